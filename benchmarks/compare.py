@@ -0,0 +1,92 @@
+import argparse
+import json
+import sys
+
+REFERENCE = "reference"
+
+
+def load(path: str, key: str = "name") -> dict[str, dict]:
+    with open(path) as results_file:
+        return {result[key]: result for result in json.load(results_file)["results"]}
+
+
+def compare(
+    before: dict,
+    after: dict,
+    statistic: str = "min",
+    before_reference: dict = None,
+    after_reference: dict = None,
+) -> float:
+    """Change of a benchmark as a fraction of its baseline.
+
+    Given the reference benchmark of each run, both timings are taken relative
+    to it first, so the comparison does not depend on the machine's speed.
+    """
+    before_value = before[statistic]
+    after_value = after[statistic]
+
+    if before_reference is not None and after_reference is not None:
+        before_value /= before_reference[statistic]
+        after_value /= after_reference[statistic]
+
+    return after_value / before_value - 1
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare benchmark results against a baseline and fail when "
+        "any benchmark got slower than the threshold allows"
+    )
+    parser.add_argument("baseline")
+    parser.add_argument("results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown as a fraction of the baseline (default: 0.2)",
+    )
+    parser.add_argument(
+        "--statistic", choices=["min", "median"], default="min", help="compared value"
+    )
+    parser.add_argument(
+        "--absolute",
+        action="store_true",
+        help=f"compare absolute timings even when both files have a {REFERENCE!r} "
+        "benchmark",
+    )
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    results = load(args.results)
+    relative = not args.absolute and REFERENCE in baseline and REFERENCE in results
+
+    regressed = False
+    for name, result in results.items():
+        if name == REFERENCE and relative:
+            continue
+
+        if name not in baseline:
+            print(f"new  {name}")
+            continue
+
+        before = baseline[name][args.statistic]
+        after = result[args.statistic]
+        change = compare(
+            baseline[name],
+            result,
+            args.statistic,
+            baseline[REFERENCE] if relative else None,
+            results[REFERENCE] if relative else None,
+        )
+        failed = change > args.threshold
+        regressed = regressed or failed
+        print(
+            f"{'FAIL' if failed else 'ok':4} {name}: "
+            f"{before * 1e6:.2f} -> {after * 1e6:.2f} us/row ({change:+.1%})"
+        )
+
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import argparse
+import datetime
+import gc
+import json
+import platform
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+from server.database.models import (
+    Action as DbAction,
+    Company as DbCompany,
+    Department as DbDepartment,
+    Employee as DbEmployee,
+    EmployeeGender,
+)
+from server.model.department import Department
+from server.model.employee import Employee
+from server.repo.actions_repository_impl import (
+    action_to_db_action,
+    db_action_to_action,
+)
+from server.repo.departments_repository import DepartmentsRepository
+from server.repo.employees_repository_impl import employee_from_db
+from server.services.convert_actions_to_schemas import convert_actions_to_schemas
+from server.services.employees_service_impl import employee_from_model
+
+from .compare import REFERENCE
+from .seed import _action_history
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    rows: int
+    rounds: int
+    min: float
+    median: float
+
+
+class InMemoryDepartmentsRepository(DepartmentsRepository):
+    def __init__(self, departments: list[Department]):
+        self._departments = {department.id: department for department in departments}
+
+    def get_department(self, department_id: int) -> Department:
+        return self._departments.get(department_id)
+
+
+class Fixtures:
+    def __init__(self, employees: int, departments: int = 20, seed: int = 0):
+        rng = random.Random(seed)
+
+        company = DbCompany(
+            id=1, name="Компания", inn="1234567890", kpp="123456789", owner_id=1
+        )
+        db_departments = {
+            number: DbDepartment(
+                id=number, name=f"Отдел {number}", company_id=1, company=company
+            )
+            for number in range(1, departments + 1)
+        }
+
+        self.db_employees = []
+        self.db_actions = []
+
+        for employee_id in range(1, employees + 1):
+            db_employee = DbEmployee(
+                id=employee_id,
+                owner_id=1,
+                name=f"Сотрудник {employee_id}",
+                gender=rng.choice(list(EmployeeGender)),
+                birthdate=datetime.datetime(1990, 1, 1),
+                inn="123456789012",
+                snils="12345678901",
+                address="ул. Тестовая",
+                passport_number="1234567890",
+                passport_date="2015-01-01",
+                passport_issuer="ОВД",
+            )
+            db_employee.actions = [
+                self._db_action(row, len(self.db_actions) + number, db_departments)
+                for number, row in enumerate(
+                    _action_history(rng, employee_id, list(db_departments)), 1
+                )
+            ]
+            self.db_employees.append(db_employee)
+            self.db_actions.extend(db_employee.actions)
+
+        self.employees = [employee_from_db(employee) for employee in self.db_employees]
+        self.actions = [db_action_to_action(action) for action in self.db_actions]
+        self.action_histories = [
+            [db_action_to_action(action) for action in employee.actions]
+            for employee in self.db_employees
+        ]
+        self.departments_repository = InMemoryDepartmentsRepository(
+            [
+                Department(
+                    id=department.id,
+                    owner_id=1,
+                    name=department.name,
+                    company_id=department.company_id,
+                )
+                for department in db_departments.values()
+            ]
+        )
+
+    @staticmethod
+    def _db_action(
+        row: dict, action_id: int, departments: dict[int, DbDepartment]
+    ) -> DbAction:
+        row = dict(row, id=action_id)
+        db_action_class = DbAction.__mapper__.polymorphic_map[row["action_type"]].class_
+        db_action = db_action_class(**row)
+
+        if "department_id" in row:
+            db_action.department = departments[row["department_id"]]
+        if "new_department_id" in row:
+            db_action.new_department = departments[row["new_department_id"]]
+
+        return db_action
+
+
+def benchmarks(fixtures: Fixtures) -> dict[str, tuple[int, Callable[[], object]]]:
+    return {
+        # Plain per-row Python work that no change to the server affects.
+        # benchmarks.compare divides by it to cancel out the machine's speed.
+        REFERENCE: (
+            len(fixtures.employees),
+            lambda: [Employee(**vars(employee)) for employee in fixtures.employees],
+        ),
+        "employee_from_db": (
+            len(fixtures.db_employees),
+            lambda: [employee_from_db(employee) for employee in fixtures.db_employees],
+        ),
+        "employee_from_model": (
+            len(fixtures.employees),
+            lambda: [employee_from_model(employee) for employee in fixtures.employees],
+        ),
+        "db_action_to_action": (
+            len(fixtures.db_actions),
+            lambda: [db_action_to_action(action) for action in fixtures.db_actions],
+        ),
+        "action_to_db_action": (
+            len(fixtures.actions),
+            lambda: [action_to_db_action(action) for action in fixtures.actions],
+        ),
+        "convert_actions_to_schemas": (
+            len(fixtures.actions),
+            lambda: [
+                list(
+                    convert_actions_to_schemas(fixtures.departments_repository, history)
+                )
+                for history in fixtures.action_histories
+            ],
+        ),
+        "Employee.current_position": (
+            len(fixtures.db_employees),
+            lambda: [employee.current_position for employee in fixtures.db_employees],
+        ),
+        "Employee.current_department": (
+            len(fixtures.db_employees),
+            lambda: [employee.current_department for employee in fixtures.db_employees],
+        ),
+        "Employee.current_salary": (
+            len(fixtures.db_employees),
+            lambda: [employee.current_salary for employee in fixtures.db_employees],
+        ),
+        "Employee.current_company": (
+            len(fixtures.db_employees),
+            lambda: [employee.current_company for employee in fixtures.db_employees],
+        ),
+    }
+
+
+def measure(
+    name: str, rows: int, function: Callable[[], object], rounds: int
+) -> BenchmarkResult:
+    function()
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - started) / rows)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return BenchmarkResult(
+        name=name,
+        rows=rows,
+        rounds=rounds,
+        min=min(timings),
+        median=statistics.median(timings),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time the per-row domain conversions on in-memory fixtures"
+    )
+    parser.add_argument("--employees", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        help="benchmark to run, may be repeated (default: all)",
+    )
+    parser.add_argument("--output", default="conversions.json")
+    args = parser.parse_args()
+
+    suite = benchmarks(Fixtures(args.employees))
+    results = []
+
+    for name in args.benchmark or suite:
+        rows, function = suite[name]
+        result = measure(name, rows, function, args.rounds)
+        print(
+            f"{result.name:<28} {result.min * 1e6:9.2f} us/row min "
+            f"{result.median * 1e6:9.2f} us/row median ({rows} rows)"
+        )
+        results.append(asdict(result))
+
+    with open(args.output, "w") as output:
+        json.dump(
+            {"python": platform.python_version(), "results": results},
+            output,
+            indent=2,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import time
+import uuid
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass
+
+from fastapi.dependencies.utils import solve_dependencies
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.routing import Match
+
+from server.database.database import Base, SessionLocal, engine
+from server.main import create_app
+from server.model.auth.access_token import AccessToken
+
+from .seed import seed_tenant
+
+ROUTES = [
+    "/companies/",
+    "/companies/{company_id}",
+    "/departments/{department_id}",
+    "/employees/company/{company_id}",
+    "/employees/{employee_id}",
+    "/actions/employee/{employee_id}",
+    "/reports/company/{company_id}",
+]
+
+
+@dataclass
+class DependencyResult:
+    name: str
+    dependencies: int
+    rounds: int
+    min: float
+    median: float
+
+
+def _count_dependencies(dependant) -> int:
+    return sum(1 + _count_dependencies(dep) for dep in dependant.dependencies)
+
+
+def _request(app, path: str, token: str) -> tuple[APIRoute, dict]:
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 50000),
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "app": app,
+    }
+
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            match, child_scope = route.matches(scope)
+
+            if match == Match.FULL:
+                return route, {**scope, **child_scope}
+
+    raise LookupError(path)
+
+
+async def _resolve(route: APIRoute, scope: dict) -> None:
+    async with AsyncExitStack() as stack:
+        _, errors, *_ = await solve_dependencies(
+            request=Request(scope),
+            dependant=route.dependant,
+            async_exit_stack=stack,
+        )
+
+    if errors:
+        raise RuntimeError(errors)
+
+
+async def measure(
+    route: APIRoute, scope: dict, requests: int, rounds: int
+) -> DependencyResult:
+    await _resolve(route, scope)
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+
+            for _ in range(requests):
+                await _resolve(route, scope)
+
+            timings.append((time.perf_counter() - started) / requests)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return DependencyResult(
+        name=route.path,
+        dependencies=_count_dependencies(route.dependant),
+        rounds=rounds,
+        min=min(timings),
+        median=statistics.median(timings),
+    )
+
+
+async def run(routes: list[str], requests: int, rounds: int) -> list[DependencyResult]:
+    Base.metadata.create_all(engine)
+
+    with SessionLocal() as db:
+        tenant = seed_tenant(
+            db,
+            2,
+            10,
+            email=f"dependencies-{uuid.uuid4().hex}@example.com",
+            password_hash="-",
+        )
+
+    token = AccessToken.new(tenant.user_id).token
+    path_params = {
+        "company_id": tenant.company_id,
+        "department_id": tenant.department_ids[0],
+        "employee_id": tenant.employee_ids[0],
+    }
+    app = create_app()
+    results = []
+
+    async with app.router.lifespan_context(app):
+        for path in routes:
+            route, scope = _request(app, path.format(**path_params), token)
+            results.append(await measure(route, scope, requests, rounds))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time the resolution of each route's Depends graph, without "
+        "running the endpoint, against the database configured in the settings"
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument(
+        "--route", action="append", help="route to run, may be repeated (default: all)"
+    )
+    parser.add_argument("--output", default="dependency_resolution.json")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.route or ROUTES, args.requests, args.rounds))
+
+    for result in results:
+        print(
+            f"{result.name:<34} {result.min * 1e6:9.2f} us min "
+            f"{result.median * 1e6:9.2f} us median "
+            f"({result.dependencies} dependencies)"
+        )
+
+    with open(args.output, "w") as output:
+        json.dump(
+            {"python": platform.python_version(), "results": list(map(asdict, results))},
+            output,
+            indent=2,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+import argparse
+import http.client
+import json
+import math
+import platform
+import random
+import threading
+import time
+import urllib.parse
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+
+from .seed import POSITIONS
+
+SCENARIOS = {
+    "browse": {"list_employees": 5, "view_timeline": 10, "download_report": 1},
+    "write": {"view_timeline": 5, "create_action": 5},
+    "login": {"login": 1},
+    "mixed": {
+        "login": 1,
+        "list_employees": 5,
+        "view_timeline": 10,
+        "create_action": 3,
+        "download_report": 1,
+    },
+}
+
+
+@dataclass
+class EndpointResult:
+    endpoint: str
+    requests: int
+    errors: int
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class ResponseError(Exception):
+    pass
+
+
+class VirtualUser:
+    def __init__(self, base_url: str, tenant: dict, rng: random.Random):
+        url = urllib.parse.urlsplit(base_url)
+        connection_class = (
+            http.client.HTTPSConnection
+            if url.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._connection = connection_class(url.hostname, url.port, timeout=60)
+        self._tenant = tenant
+        self._rng = rng
+        self._token = None
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _request(
+        self, method: str, path: str, body: bytes = None, headers: dict = None
+    ) -> bytes:
+        headers = dict(headers or {})
+
+        if self._token and "Authorization" not in headers:
+            headers["Authorization"] = f"Bearer {self._token}"
+
+        try:
+            self._connection.request(method, path, body=body, headers=headers)
+            response = self._connection.getresponse()
+            content = response.read()
+        except (http.client.HTTPException, OSError):
+            self._connection.close()
+            raise
+
+        if response.status == 401 and self._token:
+            self._token = None
+
+        if response.status >= 400:
+            raise ResponseError(response.status)
+
+        return content
+
+    def _json(self, method: str, path: str, payload: dict) -> bytes:
+        return self._request(
+            method,
+            path,
+            json.dumps(payload).encode(),
+            {"Content-Type": "application/json"},
+        )
+
+    def ensure_logged_in(self) -> None:
+        if self._token is None:
+            self.login()
+
+    def login(self) -> None:
+        form = urllib.parse.urlencode(
+            {
+                "grant_type": "password",
+                "username": self._tenant["email"],
+                "password": self._tenant["password"],
+            }
+        )
+        content = self._request(
+            "POST",
+            "/auth/token",
+            form.encode(),
+            {"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        self._token = json.loads(content)["access_token"]
+
+    def list_employees(self) -> None:
+        department_id = self._rng.choice(self._tenant["department_ids"])
+        self._request("GET", f"/employees/department/{department_id}")
+
+    def view_timeline(self) -> None:
+        employee_id = self._rng.choice(self._tenant["employee_ids"])
+        self._request("GET", f"/actions/employee/{employee_id}")
+
+    def create_action(self) -> None:
+        employee_id = self._rng.choice(self._tenant["employee_ids"])
+        action = self._rng.choice(
+            [
+                {"action_type": "salary_change", "new_salary": 100_000},
+                {
+                    "action_type": "position_transfer",
+                    "new_position": self._rng.choice(POSITIONS),
+                },
+            ]
+        )
+        self._json(
+            "POST",
+            f"/actions/employee/{employee_id}",
+            {**action, "date": "2030-01-01"},
+        )
+
+    def download_report(self) -> None:
+        self._request("GET", f"/reports/company/{self._tenant['company_id']}")
+
+
+def _percentile(latencies: list[float], percentile: float) -> float:
+    if not latencies:
+        return 0.0
+    return latencies[max(0, math.ceil(percentile / 100 * len(latencies)) - 1)]
+
+
+def run(
+    base_url: str,
+    tenants: list[dict],
+    mix: dict[str, float],
+    users: int,
+    duration: float,
+    seed: int,
+) -> list[EndpointResult]:
+    endpoints = list(mix)
+    weights = [mix[endpoint] for endpoint in endpoints]
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    lock = threading.Lock()
+    window = {}
+
+    def start_window() -> None:
+        window["started"] = time.perf_counter()
+        window["deadline"] = window["started"] + duration
+
+    start = threading.Barrier(users + 1, action=start_window)
+
+    def virtual_user(number: int) -> None:
+        rng = random.Random(seed + number)
+        user = VirtualUser(base_url, tenants[number % len(tenants)], rng)
+        own_latencies = defaultdict(list)
+        own_errors = defaultdict(int)
+
+        try:
+            user.ensure_logged_in()
+        except (ResponseError, http.client.HTTPException, OSError):
+            own_errors["login"] += 1
+        finally:
+            start.wait()
+
+        while time.perf_counter() < window["deadline"]:
+            endpoint = rng.choices(endpoints, weights)[0]
+
+            if endpoint != "login":
+                try:
+                    user.ensure_logged_in()
+                except (ResponseError, http.client.HTTPException, OSError):
+                    own_errors["login"] += 1
+                    continue
+
+            started = time.perf_counter()
+
+            try:
+                getattr(user, endpoint)()
+            except (ResponseError, http.client.HTTPException, OSError):
+                own_errors[endpoint] += 1
+            else:
+                own_latencies[endpoint].append(time.perf_counter() - started)
+
+        user.close()
+
+        with lock:
+            for endpoint, values in own_latencies.items():
+                latencies[endpoint].extend(values)
+            for endpoint, count in own_errors.items():
+                errors[endpoint] += count
+
+    threads = [
+        threading.Thread(target=virtual_user, args=(number,), daemon=True)
+        for number in range(users)
+    ]
+    for thread in threads:
+        thread.start()
+
+    start.wait()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - window["started"]
+    results = []
+
+    for endpoint in sorted(set(latencies) | set(errors)):
+        values = sorted(latencies[endpoint])
+        results.append(
+            EndpointResult(
+                endpoint=endpoint,
+                requests=len(values),
+                errors=errors[endpoint],
+                throughput=len(values) / elapsed,
+                p50=_percentile(values, 50),
+                p95=_percentile(values, 95),
+                p99=_percentile(values, 99),
+                max=values[-1] if values else 0.0,
+            )
+        )
+
+    return results
+
+
+def _parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+
+    for item in value.split(","):
+        endpoint, _, weight = item.partition("=")
+
+        if not hasattr(VirtualUser, endpoint) or endpoint.startswith("_"):
+            raise argparse.ArgumentTypeError(f"unknown endpoint {endpoint!r}")
+
+        mix[endpoint] = float(weight or 1)
+
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Drive a running server with concurrent virtual users and "
+        "report throughput and latency percentiles per endpoint. The server's "
+        "auth rate limits (AUTH_IP_RATE, AUTH_IP_BURST, AUTH_EMAIL_RATE, "
+        "AUTH_EMAIL_BURST) should be raised for login-heavy scenarios."
+    )
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument(
+        "--tenants",
+        default="load_test_tenants.json",
+        help="manifest written by benchmarks.seed_database",
+    )
+    parser.add_argument("--scenario", choices=SCENARIOS, default="mixed")
+    parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        help="custom endpoint weights, e.g. view_timeline=3,create_action=1; "
+        "overrides --scenario",
+    )
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="also write the results as JSON")
+    args = parser.parse_args()
+
+    with open(args.tenants) as tenants_file:
+        tenants = json.load(tenants_file)["tenants"]
+
+    mix = args.mix or SCENARIOS[args.scenario]
+    results = run(args.base_url, tenants, mix, args.users, args.duration, args.seed)
+
+    print(
+        f"{'endpoint':<16}{'requests':>10}{'errors':>8}{'req/s':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    )
+    for result in results:
+        print(
+            f"{result.endpoint:<16}{result.requests:>10}{result.errors:>8}"
+            f"{result.throughput:>10.1f}{result.p50 * 1000:>10.1f}"
+            f"{result.p95 * 1000:>10.1f}{result.p99 * 1000:>10.1f}"
+            f"{result.max * 1000:>10.1f}"
+        )
+    print(
+        f"{'total':<16}{sum(result.requests for result in results):>10}"
+        f"{sum(result.errors for result in results):>8}"
+        f"{sum(result.throughput for result in results):>10.1f}"
+    )
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "base_url": args.base_url,
+                    "mix": mix,
+                    "users": args.users,
+                    "duration": args.duration,
+                    "results": [asdict(result) for result in results],
+                },
+                output,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
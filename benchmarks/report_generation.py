@@ -0,0 +1,152 @@
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from server.cache.lru_cache import LRUCache
+from server.database.database import Base
+from server.repo.companies_repository_impl import CompaniesRepositoryImpl
+from server.repo.departments_repository_impl import DepartmentsRepositoryImpl
+from server.repo.employees_repository_impl import EmployeesRepositoryImpl
+from server.repo.ownership_repository_impl import OwnershipRepositoryImpl
+from server.services.ownership_service import OwnershipService
+from server.services.reports_service_impl import ReportsServiceImpl
+
+from .seed import SeededTenant, seed_tenant
+
+
+SCENARIOS = {
+    "tiny": (2, 100),
+    "small": (10, 1_000),
+    "medium": (100, 10_000),
+    "large": (1_000, 100_000),
+}
+
+
+@dataclass
+class ReportResult:
+    scenario: str
+    departments: int
+    employees: int
+    actions: int
+    wall_time: float
+    queries: int
+    peak_memory: int
+    report_size: int
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def _generate_report(session_factory, tenant: SeededTenant) -> bytes:
+    with session_factory() as db:
+        reports_service = ReportsServiceImpl(
+            CompaniesRepositoryImpl(db),
+            DepartmentsRepositoryImpl(db),
+            EmployeesRepositoryImpl(db),
+            OwnershipService(OwnershipRepositoryImpl(db), LRUCache(1)),
+        )
+        return reports_service.generate_report(tenant.user_id, tenant.company_id)
+
+
+def run_scenario(database_url: str, scenario: str, wipe: bool = False) -> ReportResult:
+    departments, employees = SCENARIOS[scenario]
+
+    engine = create_engine(database_url)
+
+    if engine.dialect.name != "sqlite" and not wipe:
+        engine.dispose()
+        raise ValueError(
+            f"{engine.url!r} would be wiped, only SQLite databases are used "
+            "without --wipe"
+        )
+
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with session_factory() as db:
+        tenant = seed_tenant(db, departments, employees)
+
+    counter = QueryCounter(engine)
+    started = time.perf_counter()
+    report = _generate_report(session_factory, tenant)
+    wall_time = time.perf_counter() - started
+    queries = counter.count
+
+    tracemalloc.start()
+    _generate_report(session_factory, tenant)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    engine.dispose()
+
+    return ReportResult(
+        scenario=scenario,
+        departments=departments,
+        employees=employees,
+        actions=tenant.actions,
+        wall_time=wall_time,
+        queries=queries,
+        peak_memory=peak_memory,
+        report_size=len(report),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure ReportsServiceImpl.generate_report on synthetic tenants"
+    )
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:///report_generation.db",
+        help="database the synthetic tenants are seeded into, it is wiped first",
+    )
+    parser.add_argument(
+        "--wipe",
+        action="store_true",
+        help="allow wiping a database that is not SQLite",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="scenario to run, may be repeated (default: all)",
+    )
+    parser.add_argument("--output", default="report_generation.json")
+    args = parser.parse_args()
+
+    results = []
+    for scenario in args.scenario or SCENARIOS:
+        try:
+            result = run_scenario(args.database_url, scenario, args.wipe)
+        except ValueError as e:
+            parser.error(str(e))
+
+        print(
+            f"{result.scenario}: {result.wall_time:.3f}s, {result.queries} queries, "
+            f"{result.peak_memory / 2**20:.1f} MiB peak"
+        )
+        results.append(asdict(result))
+
+    with open(args.output, "w") as output:
+        json.dump(
+            {"python": platform.python_version(), "results": results},
+            output,
+            indent=2,
+        )
+
+
+if __name__ == "__main__":
+    main()
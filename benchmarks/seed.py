@@ -0,0 +1,171 @@
+import datetime
+import random
+from dataclasses import dataclass
+
+from passlib.context import CryptContext
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from server.database.models import (
+    Action as DbAction,
+    Company as DbCompany,
+    Department as DbDepartment,
+    Employee as DbEmployee,
+    EmployeeGender,
+    User as DbUser,
+)
+
+
+POSITIONS = ["Инженер", "Бухгалтер", "Менеджер", "Аналитик", "Юрист", "Оператор"]
+PASSWORD = "password"
+BATCH_SIZE = 5000
+
+
+@dataclass
+class SeededTenant:
+    user_id: int
+    email: str
+    company_id: int
+    department_ids: list[int]
+    employee_ids: list[int]
+    employees: int
+    actions: int
+
+
+def _random_date(rng: random.Random, start: datetime.date, days: int) -> datetime.date:
+    return start + datetime.timedelta(days=rng.randrange(days))
+
+
+def _action_history(
+    rng: random.Random, employee_id: int, department_ids: list[int]
+) -> list[dict]:
+    date = _random_date(rng, datetime.date(2010, 1, 1), 365 * 10)
+    salary = float(rng.randrange(30_000, 300_000, 1000))
+    actions = [
+        {
+            "action_type": "recruitment",
+            "employee_id": employee_id,
+            "date": date,
+            "department_id": rng.choice(department_ids),
+            "position": rng.choice(POSITIONS),
+            "salary": salary,
+        }
+    ]
+
+    for _ in range(rng.randrange(6)):
+        date += datetime.timedelta(days=rng.randrange(30, 400))
+        action_type = rng.choice(
+            ["position_transfer", "department_transfer", "salary_change"]
+        )
+        action = {"action_type": action_type, "employee_id": employee_id, "date": date}
+
+        if action_type == "position_transfer":
+            action["new_position"] = rng.choice(POSITIONS)
+        elif action_type == "department_transfer":
+            action["new_department_id"] = rng.choice(department_ids)
+        else:
+            salary = round(salary * rng.uniform(1.0, 1.3), -3)
+            action["new_salary"] = salary
+
+        actions.append(action)
+
+    if rng.random() < 0.1:
+        date += datetime.timedelta(days=rng.randrange(30, 400))
+        actions.append(
+            {"action_type": "dismissal", "employee_id": employee_id, "date": date}
+        )
+
+    return actions
+
+
+def _insert(db: Session, table, rows: list[dict]) -> None:
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.execute(insert(table), rows[start : start + BATCH_SIZE])
+
+
+def _normalize(rows: list[dict], keys: list[str]) -> list[dict]:
+    return [{key: row.get(key) for key in keys} for row in rows]
+
+
+def seed_tenant(
+    db: Session,
+    departments: int,
+    employees: int,
+    *,
+    email: str = None,
+    seed: int = 0,
+    password_hash: str = None,
+) -> SeededTenant:
+    rng = random.Random(seed)
+    email = email or f"tenant{seed}@example.com"
+
+    if password_hash is None:
+        password_hash = CryptContext(schemes=["bcrypt"]).hash(PASSWORD)
+
+    user = DbUser(email=email, password_hash=password_hash)
+    db.add(user)
+    db.flush()
+
+    company = DbCompany(
+        name=f"Компания {seed}", inn="1234567890", kpp="123456789", owner_id=user.id
+    )
+    db.add(company)
+    db.flush()
+
+    db_departments = [
+        DbDepartment(name=f"Отдел {number}", company_id=company.id)
+        for number in range(departments)
+    ]
+    db.add_all(db_departments)
+    db.flush()
+    department_ids = [department.id for department in db_departments]
+
+    employee_rows = [
+        {
+            "name": f"Сотрудник {number}",
+            "gender": rng.choice(list(EmployeeGender)),
+            "birthdate": datetime.datetime.combine(
+                _random_date(rng, datetime.date(1960, 1, 1), 365 * 40),
+                datetime.time(),
+            ),
+            "inn": f"{rng.randrange(10**12):012d}",
+            "snils": f"{rng.randrange(10**11):011d}",
+            "address": f"ул. Тестовая, д. {number}",
+            "passport_number": f"{rng.randrange(10**10):010d}",
+            "passport_date": "2015-01-01",
+            "passport_issuer": "ОВД",
+            "owner_id": user.id,
+        }
+        for number in range(employees)
+    ]
+    employee_ids = [
+        employee_id
+        for start in range(0, len(employee_rows), BATCH_SIZE)
+        for employee_id in db.scalars(
+            insert(DbEmployee.__table__)
+            .returning(DbEmployee.__table__.c.id, sort_by_parameter_order=True),
+            employee_rows[start : start + BATCH_SIZE],
+        )
+    ]
+
+    action_rows = [
+        action
+        for employee_id in employee_ids
+        for action in _action_history(rng, employee_id, department_ids)
+    ]
+    action_keys = [
+        column.key for column in DbAction.__table__.columns if column.key != "id"
+    ]
+    _insert(db, DbAction.__table__, _normalize(action_rows, action_keys))
+
+    db.commit()
+
+    return SeededTenant(
+        user_id=user.id,
+        email=email,
+        company_id=company.id,
+        department_ids=department_ids,
+        employee_ids=employee_ids,
+        employees=employees,
+        actions=len(action_rows),
+    )
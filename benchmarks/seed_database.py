@@ -0,0 +1,79 @@
+import argparse
+import json
+import time
+
+from passlib.context import CryptContext
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from server.database.database import Base
+
+from .seed import PASSWORD, seed_tenant
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Seed synthetic tenants for load testing and write a manifest"
+    )
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--tenants", type=int, default=10)
+    parser.add_argument("--departments", type=int, default=20)
+    parser.add_argument("--employees", type=int, default=1_000)
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="drop and recreate all tables first instead of adding to them",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the first tenant's data"
+    )
+    parser.add_argument("--output", default="load_test_tenants.json")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+
+    if args.reset:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    password_hash = CryptContext(schemes=["bcrypt"]).hash(PASSWORD)
+    started = time.perf_counter()
+    tenants = []
+    actions = 0
+
+    for seed in range(args.seed, args.seed + args.tenants):
+        with session_factory() as db:
+            tenant = seed_tenant(
+                db,
+                args.departments,
+                args.employees,
+                email=f"load{seed}@example.com",
+                seed=seed,
+                password_hash=password_hash,
+            )
+
+        actions += tenant.actions
+        tenants.append(
+            {
+                "email": tenant.email,
+                "password": PASSWORD,
+                "company_id": tenant.company_id,
+                "department_ids": tenant.department_ids,
+                "employee_ids": tenant.employee_ids,
+            }
+        )
+
+    engine.dispose()
+
+    with open(args.output, "w") as output:
+        json.dump({"tenants": tenants}, output)
+
+    print(
+        f"seeded {args.tenants} tenants, {args.tenants * args.employees} employees "
+        f"and {actions} actions in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,8 @@ config = context.config
 settings = get_settings()
 config.set_main_option(
     "sqlalchemy.url",
-    f"postgresql://{settings.postgres_username}:{settings.postgres_password}@{settings.postgres_host}:{settings.postgres_port}/postgres",
+    settings.database_url
+    or f"postgresql://{settings.postgres_username}:{settings.postgres_password}@{settings.postgres_host}:{settings.postgres_port}/postgres",
 )
 
 # Interpret the config file for Python logging.
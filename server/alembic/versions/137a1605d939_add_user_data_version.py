@@ -0,0 +1,30 @@
+"""add user data version
+
+Revision ID: 137a1605d939
+Revises: 72c8850fdf3e
+Create Date: 2026-10-19 18:58:27.287126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '137a1605d939'
+down_revision: Union[str, None] = '72c8850fdf3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = sa.inspect(op.get_bind()).get_columns('users')
+    if any(column['name'] == 'data_version' for column in columns):
+        return
+
+    op.add_column('users', sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'data_version')
@@ -0,0 +1,15 @@
+from hashlib import sha256
+
+from server.cache.lru_cache import LRUCache
+
+
+class AccessTokenCache(LRUCache):
+    def get(self, token: str) -> int | None:
+        return super().get(self._digest(token))
+
+    def put(self, token: str, user_id: int, expire: float) -> None:
+        super().put(self._digest(token), user_id, expire)
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return sha256(token.encode()).digest()
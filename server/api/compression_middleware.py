@@ -0,0 +1,184 @@
+import zlib
+from typing import Callable, Protocol
+
+import brotli
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes, final: bool) -> bytes: ...
+
+
+class GzipCompressor(Compressor):
+    def __init__(self):
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+
+class BrotliCompressor(Compressor):
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=4)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self._compressor.process(data) + (
+            self._compressor.finish() if final else self._compressor.flush()
+        )
+
+
+class ZstdCompressor(Compressor):
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_FINISH
+            if final
+            else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+
+COMPRESSORS: dict[str, Callable[[], Compressor]] = {
+    "zstd": ZstdCompressor,
+    "br": BrotliCompressor,
+    "gzip": GzipCompressor,
+}
+
+
+def negotiate_encoding(accept_encoding: str, encodings: list[str]) -> str | None:
+    qualities = {}
+
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        quality = 1.0
+
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[coding.strip().lower()] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+
+    for encoding in encodings:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def _encoded_etag(etag: str, encoding: str) -> str:
+    return f'{etag[:-1]}-{encoding}"' if etag.startswith('"') else etag
+
+
+def _strip_etag_encoding(if_none_match: str, encoding: str) -> str:
+    suffix = f'-{encoding}"'
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return ", ".join(
+        (
+            f'{tag[: -len(suffix)]}"'
+            if tag.startswith('"') and tag.endswith(suffix)
+            else tag
+        )
+        for tag in tags
+    )
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int, encodings: list[str]):
+        self._app = app
+        self._minimum_size = minimum_size
+        self._compressors = {encoding: COMPRESSORS[encoding] for encoding in encodings}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), list(self._compressors)
+        )
+
+        if encoding is None:
+            await self._app(scope, receive, send)
+            return
+
+        request_headers = MutableHeaders(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        etag_stripped = False
+
+        if if_none_match:
+            request_headers["If-None-Match"] = _strip_etag_encoding(
+                if_none_match, encoding
+            )
+            etag_stripped = request_headers["if-none-match"] != if_none_match
+
+        start_message = None
+        compressor = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, compressor
+
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+
+                if message["status"] == 304 and etag_stripped and "etag" in headers:
+                    headers["ETag"] = _encoded_etag(headers["etag"], encoding)
+
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or (
+                start_message is None and compressor is None
+            ):
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                headers = MutableHeaders(scope=start_message)
+
+                if "content-encoding" in headers or (
+                    not more_body and len(body) < self._minimum_size
+                ):
+                    await send(start_message)
+                    start_message = None
+                    await send(message)
+                    return
+
+                compressor = self._compressors[encoding]()
+                body = compressor.compress(body, final=not more_body)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+
+                if "etag" in headers:
+                    headers["ETag"] = _encoded_etag(headers["etag"], encoding)
+
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+
+                await send(start_message)
+                start_message = None
+            else:
+                body = compressor.compress(body, final=not more_body)
+
+            await send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+        await self._app(scope, receive, send_compressed)
@@ -1,11 +1,29 @@
 from datetime import UTC, datetime
-from typing import Annotated
+from functools import cache, partial
+from math import ceil
+from typing import Annotated, Any, Callable, TypeVar
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query, Request, Response
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import status
 import jwt
-from server.database.database import get_db
+from redis import Redis
+from server.api.access_token_cache import AccessTokenCache
+from server.api.entity_tag import entity_tag, parse_if_none_match
+from server.api.rate_limiter import TokenBucketLimiter
+from server.cache.cache_backend import CacheBackend
+from server.cache.invalidation_bus import InvalidationBus
+from server.cache.lru_cache import LRUCache
+from server.cache.lru_cache_backend import LRUCacheBackend
+from server.cache.redis_cache_backend import RedisCacheBackend
+from server.database.database import (
+    engine,
+    is_read_replica,
+    on_transaction_end,
+    request_session,
+    run_db,
+    session_scope,
+)
 from server.model.auth.access_token import ALGORITHM, SECRET_KEY
 from server.repo.actions_repository import ActionsRepository
 from server.repo.actions_repository_impl import ActionsRepositoryImpl
@@ -15,12 +33,18 @@ from server.repo.auth.refresh_token_repository import RefreshTokenRepository
 from server.repo.auth.refresh_token_repository_impl import RefreshTokenRepositoryImpl
 from server.repo.auth.user_repository import UserRepository
 from server.repo.auth.user_repository_impl import UserRepositoryImpl
+from server.repo.cached_companies_repository import CachedCompaniesRepository
+from server.repo.cached_departments_repository import CachedDepartmentsRepository
 from server.repo.companies_repository import CompaniesRepository
 from server.repo.companies_repository_impl import CompaniesRepositoryImpl
+from server.repo.data_version_repository import DataVersionRepository
+from server.repo.data_version_repository_impl import DataVersionRepositoryImpl
 from server.repo.departments_repository import DepartmentsRepository
 from server.repo.departments_repository_impl import DepartmentsRepositoryImpl
 from server.repo.employees_repository import EmployeesRepository
 from server.repo.employees_repository_impl import EmployeesRepositoryImpl
+from server.repo.ownership_repository import OwnershipRepository
+from server.repo.ownership_repository_impl import OwnershipRepositoryImpl
 from server.services.actions_service import ActionsService
 from server.services.actions_service_impl import ActionsServiceImpl
 from server.services.auth.user_service import UserService
@@ -31,133 +55,348 @@ from server.services.companies_service import CompaniesService
 from server.services.companies_service_impl import CompaniesServiceImpl
 from server.services.employees_service import EmployeesService
 from server.services.employees_service_impl import EmployeesServiceImpl
+from server.services.ownership_service import OwnershipService
 from server.services.reports_service import ReportsService
 from server.services.reports_service_impl import ReportsServiceImpl
+from server.services.snapshots_service import SnapshotsService
+from server.services.snapshots_service_impl import SnapshotsServiceImpl
+from server.settings import get_settings
+from server.tracing.tracer import traced
+
+T = TypeVar("T")
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
-db_dependency = Annotated[Session, Depends(get_db)]
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl="auth/token")
+optional_oauth2_bearer = OAuth2PasswordBearer(tokenUrl="auth/token", auto_error=False)
+access_token_cache = AccessTokenCache(get_settings().access_token_cache_size)
+ownership_cache = LRUCache(
+    get_settings().ownership_cache_size, get_settings().ownership_cache_ttl
+)
+auth_ip_rate_limiter = TokenBucketLimiter(
+    get_settings().auth_ip_rate,
+    get_settings().auth_ip_burst,
+    get_settings().rate_limiter_size,
+)
+auth_email_rate_limiter = TokenBucketLimiter(
+    get_settings().auth_email_rate,
+    get_settings().auth_email_burst,
+    get_settings().rate_limiter_size,
+)
+recent_writers = LRUCache(
+    get_settings().recent_writers_cache_size,
+    get_settings().read_after_write_window,
+)
+
+
+def create_entity_cache() -> CacheBackend:
+    if get_settings().entity_cache_backend == "redis":
+        client = Redis.from_url(
+            get_settings().entity_cache_redis_url,
+            socket_timeout=get_settings().entity_cache_redis_timeout,
+        )
+        return RedisCacheBackend(client, get_settings().entity_cache_ttl, "entity:")
+
+    return LRUCacheBackend(
+        LRUCache(get_settings().entity_cache_size, get_settings().entity_cache_ttl)
+    )
+
+
+entity_cache = create_entity_cache()
+invalidation_bus = InvalidationBus(
+    engine, get_settings().cache_invalidation_reconnect_interval
+)
+
+
+def evict_ownership(user_ids: list[int]) -> None:
+    for user_id in user_ids:
+        ownership_cache.pop(user_id)
+
+
+invalidation_bus.register("ownership", evict_ownership, ownership_cache.clear)
+
+# Redis is shared between workers, only the in-process cache needs evicting.
+if isinstance(entity_cache, LRUCacheBackend):
+    invalidation_bus.register(
+        "entity", lambda keys: entity_cache.delete(*keys), entity_cache.clear
+    )
+
+
+def publish_entity_invalidation(db: Session, keys: list[str]) -> None:
+    if isinstance(entity_cache, LRUCacheBackend):
+        invalidation_bus.publish(db, "entity", keys)
+
+
+def get_user_id(token: str) -> int:
+    user_id = access_token_cache.get(token)
+
+    if user_id is not None:
+        return user_id
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id = payload["id"]
+        expire = payload["expire"]
+    except (jwt.DecodeError, KeyError):
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid token")
+
+    if datetime.now(UTC).timestamp() > expire:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "The token has expired")
+
+    access_token_cache.put(token, user_id, expire)
+
+    return user_id
+
+
+async def get_session(
+    request: Request,
+    token: Annotated[str | None, Depends(optional_oauth2_bearer)],
+):
+    try:
+        user_id = get_user_id(token) if token else None
+    except HTTPException:
+        user_id = None
 
+    if request.method in READ_ONLY_METHODS:
+        read_only = user_id is None or not recent_writers.get(user_id)
 
-def get_user_repository(db: db_dependency) -> UserRepository:
-    return UserRepositoryImpl(db)
+        async with session_scope(read_only) as db:
+            yield db
+        return
 
+    if user_id is not None:
+        recent_writers.put(user_id, True)
 
-def get_access_token_repository(db: db_dependency) -> AccessTokenRepository:
-    return AccessTokenRepositoryImpl(db)
+    async with session_scope() as db:
+        if user_id is not None:
+            DataVersionRepositoryImpl(db).increment_data_version_on_commit(user_id)
 
+        try:
+            yield db
+        finally:
+            if user_id is not None:
+                recent_writers.put(user_id, True)
 
-def get_refresh_token_repository(db: db_dependency) -> RefreshTokenRepository:
-    return RefreshTokenRepositoryImpl(db)
 
+session_dependency = Annotated[Session, Depends(get_session)]
 
-def get_companies_repository(db: db_dependency) -> CompaniesRepository:
-    return CompaniesRepositoryImpl(db)
 
+def bound_to_session(get_instance: Callable[[], T]) -> Any:
+    async def dependency(db: session_dependency) -> T:
+        return get_instance()
 
-def get_actions_repository(db: db_dependency) -> ActionsRepository:
-    return ActionsRepositoryImpl(db)
+    return Depends(dependency)
 
 
-def get_employees_repository(db: db_dependency) -> EmployeesRepository:
-    return EmployeesRepositoryImpl(db)
+# Repositories and services hold no per-request state, so they are built once
+# on first use and reach the request's session through request_session.
 
 
-def get_departments_repository(db: db_dependency) -> DepartmentsRepository:
-    return DepartmentsRepositoryImpl(db)
+@cache
+def get_user_repository() -> UserRepository:
+    return traced(UserRepositoryImpl(request_session), "repository")
+
+
+@cache
+def get_access_token_repository() -> AccessTokenRepository:
+    return traced(AccessTokenRepositoryImpl(request_session), "repository")
+
+
+@cache
+def get_refresh_token_repository() -> RefreshTokenRepository:
+    return traced(RefreshTokenRepositoryImpl(request_session), "repository")
+
+
+@cache
+def get_companies_repository() -> CompaniesRepository:
+    return traced(
+        CachedCompaniesRepository(
+            CompaniesRepositoryImpl(request_session),
+            entity_cache,
+            partial(on_transaction_end, request_session),
+            partial(publish_entity_invalidation, request_session),
+            populate_cache=lambda: not is_read_replica(request_session),
+        ),
+        "repository",
+    )
+
+
+@cache
+def get_actions_repository() -> ActionsRepository:
+    return traced(ActionsRepositoryImpl(request_session), "repository")
+
+
+@cache
+def get_employees_repository() -> EmployeesRepository:
+    return traced(EmployeesRepositoryImpl(request_session), "repository")
+
+
+@cache
+def get_departments_repository() -> DepartmentsRepository:
+    return traced(
+        CachedDepartmentsRepository(
+            DepartmentsRepositoryImpl(request_session),
+            get_companies_repository(),
+            entity_cache,
+            partial(on_transaction_end, request_session),
+            partial(publish_entity_invalidation, request_session),
+            populate_cache=lambda: not is_read_replica(request_session),
+        ),
+        "repository",
+    )
+
+
+@cache
+def get_ownership_repository() -> OwnershipRepository:
+    return traced(
+        OwnershipRepositoryImpl(request_session, invalidation_bus), "repository"
+    )
+
+
+@cache
+def get_data_version_repository() -> DataVersionRepository:
+    return traced(DataVersionRepositoryImpl(request_session), "repository")
 
 
 access_token_repository_dependency = Annotated[
-    UserRepository, Depends(get_access_token_repository)
+    UserRepository, bound_to_session(get_access_token_repository)
 ]
 user_repository_dependency = Annotated[
-    AccessTokenRepository, Depends(get_user_repository)
+    AccessTokenRepository, bound_to_session(get_user_repository)
 ]
 refresh_token_repository_dependency = Annotated[
-    RefreshTokenRepository, Depends(get_refresh_token_repository)
+    RefreshTokenRepository, bound_to_session(get_refresh_token_repository)
 ]
 companies_repository_dependency = Annotated[
-    CompaniesRepository, Depends(get_companies_repository)
+    CompaniesRepository, bound_to_session(get_companies_repository)
 ]
 actions_repository_dependency = Annotated[
-    ActionsRepository, Depends(get_actions_repository)
+    ActionsRepository, bound_to_session(get_actions_repository)
 ]
 employees_repository_dependency = Annotated[
-    EmployeesRepository, Depends(get_employees_repository)
+    EmployeesRepository, bound_to_session(get_employees_repository)
 ]
 departments_repository_dependency = Annotated[
-    DepartmentsRepository, Depends(get_departments_repository)
+    DepartmentsRepository, bound_to_session(get_departments_repository)
+]
+ownership_repository_dependency = Annotated[
+    OwnershipRepository, bound_to_session(get_ownership_repository)
 ]
+data_version_repository_dependency = Annotated[
+    DataVersionRepository, bound_to_session(get_data_version_repository)
+]
+
 
+@cache
+def get_ownership_service() -> OwnershipService:
+    return traced(
+        OwnershipService(get_ownership_repository(), ownership_cache), "service"
+    )
 
-def get_user_service(user_repository: user_repository_dependency) -> UserService:
-    user_service = UserService(user_repository)
-    return user_service
 
+@cache
+def get_user_service() -> UserService:
+    user_service = UserService(get_user_repository(), get_ownership_service())
+    return traced(user_service, "service")
 
-def get_token_service(
-    user_repository: user_repository_dependency,
-    access_token_repository: access_token_repository_dependency,
-    refresh_token_repository: refresh_token_repository_dependency,
-) -> TokenService:
-    return TokenService(
-        access_token_repository, refresh_token_repository, user_repository
+
+@cache
+def get_token_service() -> TokenService:
+    return traced(
+        TokenService(
+            get_access_token_repository(),
+            get_refresh_token_repository(),
+            get_user_repository(),
+        ),
+        "service",
     )
 
 
-def get_companies_service(
-    companies_repository: companies_repository_dependency,
-    employees_repository: employees_repository_dependency,
-) -> CompaniesService:
-    return CompaniesServiceImpl(companies_repository)
-
-
-def get_employees_service(
-    employees_repository: employees_repository_dependency,
-    companies_repository: companies_repository_dependency,
-    departments_repository: departments_repository_dependency,
-    actions_repository: actions_repository_dependency,
-) -> EmployeesService:
-    return EmployeesServiceImpl(
-        employees_repository,
-        companies_repository,
-        departments_repository,
-        actions_repository,
+@cache
+def get_companies_service() -> CompaniesService:
+    return traced(
+        CompaniesServiceImpl(get_companies_repository(), get_ownership_service()),
+        "service",
     )
 
 
-def get_actions_service(
-    actions_repository: actions_repository_dependency,
-    employees_repository: employees_repository_dependency,
-    departments_repository: departments_repository_dependency,
-) -> ActionsService:
-    return ActionsServiceImpl(
-        actions_repository, employees_repository, departments_repository
+@cache
+def get_employees_service() -> EmployeesService:
+    return traced(
+        EmployeesServiceImpl(
+            get_employees_repository(),
+            get_companies_repository(),
+            get_departments_repository(),
+            get_actions_repository(),
+            get_ownership_service(),
+        ),
+        "service",
     )
 
 
-def get_reports_service(
-    companies_repository: companies_repository_dependency,
-    departments_repository: departments_repository_dependency,
-    employees_repository: employees_repository_dependency,
-) -> ReportsService:
-    return ReportsServiceImpl(
-        companies_repository, departments_repository, employees_repository
+@cache
+def get_actions_service() -> ActionsService:
+    return traced(
+        ActionsServiceImpl(
+            get_actions_repository(),
+            get_employees_repository(),
+            get_departments_repository(),
+            get_ownership_service(),
+        ),
+        "service",
     )
 
 
-user_service_dependency = Annotated[UserService, Depends(get_user_service)]
-token_service_dependency = Annotated[TokenService, Depends(get_token_service)]
+@cache
+def get_reports_service() -> ReportsService:
+    return traced(
+        ReportsServiceImpl(
+            get_companies_repository(),
+            get_departments_repository(),
+            get_employees_repository(),
+            get_ownership_service(),
+        ),
+        "service",
+    )
+
+
+@cache
+def get_snapshots_service() -> SnapshotsService:
+    return traced(
+        SnapshotsServiceImpl(
+            get_companies_repository(),
+            get_departments_repository(),
+            get_employees_repository(),
+            get_actions_repository(),
+            get_ownership_service(),
+        ),
+        "service",
+    )
+
+
+ownership_service_dependency = Annotated[
+    OwnershipService, bound_to_session(get_ownership_service)
+]
+user_service_dependency = Annotated[UserService, bound_to_session(get_user_service)]
+token_service_dependency = Annotated[TokenService, bound_to_session(get_token_service)]
 companies_service_dependency = Annotated[
-    CompaniesService, Depends(get_companies_service)
+    CompaniesService, bound_to_session(get_companies_service)
+]
+actions_service_dependency = Annotated[
+    ActionsService, bound_to_session(get_actions_service)
+]
+reports_service_dependency = Annotated[
+    ReportsService, bound_to_session(get_reports_service)
 ]
-actions_service_dependency = Annotated[ActionsService, Depends(get_actions_service)]
-reports_service_dependency = Annotated[ReportsService, Depends(get_reports_service)]
 employees_service_dependency = Annotated[
-    EmployeesService, Depends(get_employees_service)
+    EmployeesService, bound_to_session(get_employees_service)
+]
+snapshots_service_dependency = Annotated[
+    SnapshotsService, bound_to_session(get_snapshots_service)
 ]
 
 
-def get_current_user(
+async def get_current_user(
     token: Annotated[
         str,
         Depends(
@@ -165,17 +404,71 @@ def get_current_user(
         ),
     ]
 ):
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload["id"]
-        expire = payload["expire"]
-    except (jwt.DecodeError, KeyError):
-        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid token")
+    return {"id": get_user_id(token)}
 
-    if datetime.now(UTC).timestamp() > expire:
-        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "The token has expired")
 
-    return {"id": user_id}
+user_dependency = Annotated[dict, Depends(get_current_user)]
 
 
-user_dependency = Annotated[dict, Depends(get_current_user)]
+async def get_entity_tag(
+    request: Request,
+    response: Response,
+    user: user_dependency,
+    data_version_repository: data_version_repository_dependency,
+) -> str:
+    data_version = await run_db(data_version_repository.get_data_version, user["id"])
+    etag = entity_tag(user["id"], data_version, request.url.path, request.url.query)
+    current_etag = etag
+
+    if is_read_replica(request_session):
+        # recent_writers is per process, so after a write through another
+        # worker the replica can still be behind. Only the primary's version
+        # tells whether the client's copy is current.
+        async with session_scope():
+            current_version = await run_db(
+                data_version_repository.get_data_version, user["id"]
+            )
+
+        current_etag = entity_tag(
+            user["id"], current_version, request.url.path, request.url.query
+        )
+
+    if current_etag in parse_if_none_match(request.headers.get("if-none-match")):
+        raise HTTPException(
+            status.HTTP_304_NOT_MODIFIED, headers={"ETag": current_etag}
+        )
+
+    response.headers["ETag"] = etag
+    return etag
+
+
+entity_tag_dependency = Annotated[str, Depends(get_entity_tag)]
+
+
+async def get_batch_ids(ids: Annotated[list[int], Query()]) -> list[int]:
+    max_ids = get_settings().batch_get_max_ids
+
+    if len(ids) > max_ids:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST, f"At most {max_ids} ids can be requested"
+        )
+
+    return list(dict.fromkeys(ids))
+
+
+batch_ids_dependency = Annotated[list[int], Depends(get_batch_ids)]
+
+
+def check_auth_rate_limit(request: Request, email: str) -> None:
+    client_ip = request.client.host if request.client else None
+    retry_after = auth_ip_rate_limiter.acquire(client_ip)
+
+    if not retry_after:
+        retry_after = auth_email_rate_limiter.acquire(email.strip().lower())
+
+    if retry_after:
+        raise HTTPException(
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            "Too many authentication attempts",
+            headers={"Retry-After": str(ceil(retry_after))},
+        )
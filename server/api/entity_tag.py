@@ -0,0 +1,20 @@
+import hashlib
+import hmac
+
+from server.model.auth.access_token import SECRET_KEY
+
+
+def entity_tag(user_id: int, data_version: int, path: str, query: str) -> str:
+    digest = hmac.new(
+        SECRET_KEY.encode(),
+        f"{user_id}:{data_version}:{path}?{query}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def parse_if_none_match(if_none_match: str | None) -> set[str]:
+    if not if_none_match:
+        return set()
+
+    return {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
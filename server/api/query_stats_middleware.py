@@ -0,0 +1,55 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from server.database.query_stats import QueryStats, query_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    def __init__(
+        self, app: ASGIApp, detect_n_plus_one: bool, n_plus_one_threshold: int
+    ):
+        self._app = app
+        self._detect_n_plus_one = detect_n_plus_one
+        self._n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        stats = QueryStats(track_statements=self._detect_n_plus_one)
+        token = query_stats.set(stats)
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.3f};desc="{stats.count} queries"',
+                )
+
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_with_server_timing)
+        finally:
+            query_stats.reset(token)
+
+            if self._detect_n_plus_one:
+                self._report_repeated_statements(scope, stats)
+
+    def _report_repeated_statements(self, scope: Scope, stats: QueryStats) -> None:
+        for statement, count, origin in stats.repeated_statements(
+            self._n_plus_one_threshold
+        ):
+            logger.warning(
+                "Possible N+1 in %s %s: %d executions from %s of %s",
+                scope["method"],
+                scope["path"],
+                count,
+                origin,
+                " ".join(statement.split()),
+            )
@@ -0,0 +1,38 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable
+
+
+class TokenBucketLimiter:
+    def __init__(self, rate: float, burst: int, maxsize: int):
+        self._rate = rate
+        self._burst = burst
+        self._maxsize = maxsize
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+        self._lock = Lock()
+        self.allowed = 0
+        self.limited = 0
+
+    def acquire(self, key: Hashable) -> float:
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self._burst, now))
+            tokens = min(self._burst, tokens + (now - updated) * self._rate)
+
+            if tokens >= 1:
+                retry_after = 0.0
+                tokens -= 1
+                self.allowed += 1
+            else:
+                retry_after = (1 - tokens) / self._rate
+                self.limited += 1
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+
+            while len(self._buckets) > self._maxsize:
+                self._buckets.popitem(last=False)
+
+        return retry_after
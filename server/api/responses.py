@@ -0,0 +1,36 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from server.settings import get_settings
+
+
+class FastJSONResponse(JSONResponse):
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        exclude_none: bool = False,
+    ):
+        self._exclude_none = exclude_none
+        super().__init__(content, status_code, headers)
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=self._default)
+
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return value.model_dump(exclude_none=self._exclude_none)
+        raise TypeError
+
+
+def json_response(
+    content: Any, exclude_none: bool = False, headers: dict[str, str] | None = None
+) -> Any:
+    if not get_settings().fast_json_responses:
+        return content
+
+    return FastJSONResponse(content, headers=headers, exclude_none=exclude_none)
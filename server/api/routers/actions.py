@@ -3,7 +3,9 @@ from fastapi.routing import APIRouter
 
 from server.schemas.actions import *
 from server.api.dependenicies import user_dependency, actions_service_dependency
+from server.api.responses import json_response
 from server.database import models
+from server.database.database import run_db
 from server.schemas.error import Error
 from server.services.actions_service import (
     ActionNotExistsError,
@@ -38,16 +40,18 @@ router = APIRouter(prefix="/actions", tags=["actions"])
     },
     response_model_exclude_none=True,
 )
-def get_actions(
+async def get_actions(
     actions_service: actions_service_dependency, user: user_dependency, employee_id: int
 ) -> list[ActionWrapper]:
     try:
-        return actions_service.get_actions(user["id"], employee_id)
+        actions = await run_db(actions_service.get_actions, user["id"], employee_id)
     except EmployeNotExistsError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "User does not exist")
     except ForbiddenError:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
 
+    return json_response(actions, exclude_none=True)
+
 
 @router.post(
     "/employee/{employee_id}",
@@ -58,16 +62,21 @@ def get_actions(
         status.HTTP_401_UNAUTHORIZED: {"model": Error},
     },
 )
-def create_action(
+async def create_action(
     actions_service: actions_service_dependency,
     user: user_dependency,
     employee_id: int,
     create_action_request: CreateActionRequest,
 ) -> None:
     try:
-        actions_service.create_action(
-            user["id"], employee_id, create_action_request=create_action_request
+        await run_db(
+            actions_service.create_action,
+            user["id"],
+            employee_id,
+            create_action_request=create_action_request,
         )
+    except EmployeNotExistsError:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Employee does not exist")
     except DepartmentNotExistsError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Department does not exist")
     except NoAccessToDepartmentError:
@@ -84,15 +93,18 @@ def create_action(
         status.HTTP_401_UNAUTHORIZED: {"model": Error},
     },
 )
-def edit_action(
+async def edit_action(
     actions_service: actions_service_dependency,
     user: user_dependency,
     action_id: int,
     create_action_request: CreateActionRequest,
 ) -> None:
     try:
-        actions_service.update_action(
-            user["id"], action_id, create_action_request=create_action_request
+        await run_db(
+            actions_service.update_action,
+            user["id"],
+            action_id,
+            create_action_request=create_action_request,
         )
     except ActionNotExistsError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Action does not exist")
@@ -112,11 +124,11 @@ def edit_action(
         status.HTTP_401_UNAUTHORIZED: {"model": Error},
     },
 )
-def delete_action(
+async def delete_action(
     actions_service: actions_service_dependency, user: user_dependency, action_id: int
 ):
     try:
-        actions_service.delete_action(user["id"], action_id)
+        await run_db(actions_service.delete_action, user["id"], action_id)
     except ActionNotExistsError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Action does not exist")
     except ForbiddenError:
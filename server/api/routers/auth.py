@@ -1,9 +1,13 @@
 from typing import Annotated
 from uuid import uuid4
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
+from server.model.auth.password_hasher import PasswordHasherBusyError
 from server.schemas.auth import CreateUserRequest, Token, TokenRequestForm
+from server.schemas.error import Error
+from server.database.database import run_db
 from server.api.dependenicies import (
+    check_auth_rate_limit,
     user_service_dependency,
     token_service_dependency,
     user_dependency,
@@ -19,20 +23,28 @@ from server.api.dependenicies import user_dependency
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+PASSWORD_HASHER_RETRY_AFTER = "1"
+
 
 @router.post(
     "/user",
     status_code=status.HTTP_201_CREATED,
     responses={
-        status.HTTP_409_CONFLICT: {"model": None, "description": "User already exists"}
+        status.HTTP_409_CONFLICT: {"model": None, "description": "User already exists"},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": Error},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Error},
     },
 )
-def create_user(
-    user_service: user_service_dependency, create_user_request: CreateUserRequest
+async def create_user(
+    request: Request,
+    user_service: user_service_dependency,
+    create_user_request: CreateUserRequest,
 ):
     """Creates a user with given email and password"""
+    check_auth_rate_limit(request, create_user_request.email)
+
     try:
-        user_service.create_user(
+        await user_service.create_user(
             create_user_request.email, create_user_request.password
         )
     except UserAlreadyExistsError:
@@ -42,31 +54,53 @@ def create_user(
         )
     except InvalidEmail:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Invalid email")
+    except PasswordHasherBusyError:
+        raise HTTPException(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            "Too many authentication requests",
+            headers={"Retry-After": PASSWORD_HASHER_RETRY_AFTER},
+        )
 
 
 @router.delete("/user")
-def delete_user(user_service: user_service_dependency, user: user_dependency):
-    user_service.delete_user(user["id"])
+async def delete_user(user_service: user_service_dependency, user: user_dependency):
+    await run_db(user_service.delete_user, user["id"])
 
 
-@router.post("/token")
-def get_token(
+@router.post(
+    "/token",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": Error},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": Error},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Error},
+    },
+)
+async def get_token(
+    request: Request,
     form_data: Annotated[TokenRequestForm, Depends()],
     token_service: token_service_dependency,
 ) -> Token:
     if form_data.grant_type == "password":
+        check_auth_rate_limit(request, form_data.username)
+
         try:
-            access_token, refresh_token = token_service.create_token(
+            access_token, refresh_token = await token_service.create_token(
                 form_data.username, form_data.password
             )
         except (UserDoesNotExistError, InvalidPasswordError):
             raise HTTPException(
                 status.HTTP_400_BAD_REQUEST, "Invalid email or password"
             )
+        except PasswordHasherBusyError:
+            raise HTTPException(
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "Too many authentication requests",
+                headers={"Retry-After": PASSWORD_HASHER_RETRY_AFTER},
+            )
     elif form_data.grant_type == "refresh_token":
         try:
-            access_token, refresh_token = token_service.refresh_token(
-                form_data.refresh_token
+            access_token, refresh_token = await run_db(
+                token_service.refresh_token, form_data.refresh_token
             )
         except InvalidRefreshToken:
             raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid refresh token")
@@ -3,13 +3,23 @@ from fastapi.routing import APIRouter
 
 from server.schemas.companies import (
     Company,
+    CompanySnapshot,
     CreateCompanyRequest,
     EditCompanyRequest,
     CreatedCompanyId,
 )
+from server.schemas.batch import Batch
 from server.schemas.error import Error
-from server.api.dependenicies import user_dependency, companies_service_dependency
+from server.api.dependenicies import (
+    batch_ids_dependency,
+    companies_service_dependency,
+    entity_tag_dependency,
+    snapshots_service_dependency,
+    user_dependency,
+)
+from server.api.responses import json_response
 from server.database import models
+from server.database.database import run_db
 from server.services.companies_service import CompanyNotExistError, ForbiddenError
 
 router = APIRouter(prefix="/companies", tags=["companies"])
@@ -21,12 +31,30 @@ router = APIRouter(prefix="/companies", tags=["companies"])
         status.HTTP_401_UNAUTHORIZED: {"model": Error},
     },
 )
-def get_companies(
+async def get_companies(
     companies_service: companies_service_dependency,
     user: user_dependency,
+    etag: entity_tag_dependency,
 ) -> list[Company]:
-    companies = companies_service.get_companies(user["id"])
-    return companies
+    companies = await run_db(companies_service.get_companies, user["id"])
+    return json_response(companies, headers={"ETag": etag})
+
+
+@router.get(
+    "/batch",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": Error},
+        status.HTTP_401_UNAUTHORIZED: {"model": Error},
+    },
+)
+async def get_companies_by_ids(
+    companies_service: companies_service_dependency,
+    user: user_dependency,
+    ids: batch_ids_dependency,
+    etag: entity_tag_dependency,
+) -> Batch[Company]:
+    companies = await run_db(companies_service.get_companies_by_ids, user["id"], ids)
+    return json_response(companies, headers={"ETag": etag})
 
 
 @router.get(
@@ -37,19 +65,51 @@ def get_companies(
         status.HTTP_401_UNAUTHORIZED: {"model": Error},
     },
 )
-def get_company(
+async def get_company(
     companies_service: companies_service_dependency,
     user: user_dependency,
     company_id: int,
+    etag: entity_tag_dependency,
 ) -> Company:
     try:
-        company = companies_service.get_company(user["id"], company_id)
+        company = await run_db(companies_service.get_company, user["id"], company_id)
+    except CompanyNotExistError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND)
+    except ForbiddenError:
+        raise HTTPException(status.HTTP_403_FORBIDDEN)
+
+    return json_response(company, headers={"ETag": etag})
+
+
+@router.get(
+    "/{company_id}/snapshot",
+    responses={
+        status.HTTP_404_NOT_FOUND: {"model": Error},
+        status.HTTP_403_FORBIDDEN: {"model": Error},
+        status.HTTP_401_UNAUTHORIZED: {"model": Error},
+    },
+    response_model_exclude_none=True,
+)
+async def get_company_snapshot(
+    snapshots_service: snapshots_service_dependency,
+    user: user_dependency,
+    company_id: int,
+    etag: entity_tag_dependency,
+    include_actions: bool = False,
+) -> CompanySnapshot:
+    try:
+        snapshot = await run_db(
+            snapshots_service.get_company_snapshot,
+            user["id"],
+            company_id,
+            include_actions,
+        )
     except CompanyNotExistError:
         raise HTTPException(status.HTTP_404_NOT_FOUND)
     except ForbiddenError:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
 
-    return company
+    return json_response(snapshot, exclude_none=True, headers={"ETag": etag})
 
 
 @router.post(
@@ -59,13 +119,17 @@ def get_company(
         status.HTTP_401_UNAUTHORIZED: {"model": Error},
     },
 )
-def create_company(
+async def create_company(
     companies_service: companies_service_dependency,
     user: user_dependency,
     request: CreateCompanyRequest,
 ) -> CreatedCompanyId:
-    company_id = companies_service.create_company(
-        request.name, request.inn, request.kpp, user["id"]
+    company_id = await run_db(
+        companies_service.create_company,
+        request.name,
+        request.inn,
+        request.kpp,
+        user["id"],
     )
     return CreatedCompanyId(id=company_id)
 
@@ -78,14 +142,15 @@ def create_company(
         status.HTTP_403_FORBIDDEN: {"model": Error},
     },
 )
-def edit_company(
+async def edit_company(
     companies_service: companies_service_dependency,
     user: user_dependency,
     company_id: int,
     edit_company_request: EditCompanyRequest,
 ) -> None:
     try:
-        companies_service.edit_company(
+        await run_db(
+            companies_service.edit_company,
             user["id"],
             company_id,
             name=edit_company_request.name,
@@ -2,11 +2,25 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.routing import APIRouter
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 
+from server.schemas.batch import Batch
 from server.schemas.departments import Department
 from server.api.dependenicies import user_dependency
-from server.api.dependenicies import user_dependency, db_dependency
+from server.api.dependenicies import (
+    batch_ids_dependency,
+    user_dependency,
+    session_dependency,
+    ownership_service_dependency,
+    departments_repository_dependency,
+    entity_tag_dependency,
+)
+from server.api.responses import json_response
 from server.database import models
+from server.database.database import run_db
+from server.repo.departments_repository import DepartmentsRepository
+from server.services.batch import collect_batch
+from server.services.ownership_service import OwnershipService
 
 router = APIRouter(prefix="/departments", tags=["departments"])
 
@@ -25,10 +39,45 @@ class CreatedDepartmentId(BaseModel):
     id: int = None
 
 
+@router.get("/batch")
+async def get_departments_by_ids(
+    departments_repository: departments_repository_dependency,
+    user: user_dependency,
+    ids: batch_ids_dependency,
+    etag: entity_tag_dependency,
+) -> Batch[Department]:
+    departments = await run_db(
+        _get_departments_by_ids, departments_repository, user, ids
+    )
+    return json_response(departments, headers={"ETag": etag})
+
+
+def _get_departments_by_ids(
+    departments_repository: DepartmentsRepository, user: dict, ids: list[int]
+) -> Batch[Department]:
+    departments = departments_repository.get_departments_by_ids(ids)
+    return collect_batch(
+        ids,
+        {department.id: department for department in departments},
+        user["id"],
+        lambda department: Department(
+            id=department.id, name=department.name, company_id=department.company_id
+        ),
+    )
+
+
 @router.get("/{department_id}")
-def get_department(
-    db: db_dependency, user: user_dependency, department_id: int
+async def get_department(
+    db: session_dependency,
+    user: user_dependency,
+    department_id: int,
+    etag: entity_tag_dependency,
 ) -> Department:
+    department = await run_db(_get_department, db, user, department_id)
+    return json_response(department, headers={"ETag": etag})
+
+
+def _get_department(db: Session, user: dict, department_id: int) -> Department:
     department = db.query(models.Department).filter_by(id=department_id).first()
 
     if department is None:
@@ -41,8 +90,18 @@ def get_department(
 
 
 @router.get("/company/{company_id}")
-def get_departments_by_company(
-    db: db_dependency, user: user_dependency, company_id: int
+async def get_departments_by_company(
+    db: session_dependency,
+    user: user_dependency,
+    company_id: int,
+    etag: entity_tag_dependency,
+) -> list[Department]:
+    departments = await run_db(_get_departments_by_company, db, user, company_id)
+    return json_response(departments, headers={"ETag": etag})
+
+
+def _get_departments_by_company(
+    db: Session, user: dict, company_id: int
 ) -> list[Department]:
     company = db.query(models.Company).filter_by(id=company_id).first()
 
@@ -61,8 +120,20 @@ def get_departments_by_company(
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
-def create_department(
-    db: db_dependency, user: user_dependency, request: CreateDepartmentRequest
+async def create_department(
+    db: session_dependency,
+    user: user_dependency,
+    ownership_service: ownership_service_dependency,
+    request: CreateDepartmentRequest,
+) -> CreatedDepartmentId:
+    return await run_db(_create_department, db, user, ownership_service, request)
+
+
+def _create_department(
+    db: Session,
+    user: dict,
+    ownership_service: OwnershipService,
+    request: CreateDepartmentRequest,
 ) -> CreatedDepartmentId:
     company = db.query(models.Company).filter_by(id=request.company_id).first()
 
@@ -74,15 +145,37 @@ def create_department(
 
     department = models.Department(company_id=request.company_id, name=request.name)
     db.add(department)
-    db.commit()
+    db.flush()
+    ownership_service.invalidate(user["id"])
 
     return CreatedDepartmentId(id=company.id)
 
 
 @router.patch("/{department_id}")
-def edit_department(
-    db: db_dependency,
+async def edit_department(
+    db: session_dependency,
     user: user_dependency,
+    ownership_service: ownership_service_dependency,
+    departments_repository: departments_repository_dependency,
+    department_id: int,
+    edit_department_request: EditDepartmentRequest,
+):
+    await run_db(
+        _edit_department,
+        db,
+        user,
+        ownership_service,
+        departments_repository,
+        department_id,
+        edit_department_request,
+    )
+
+
+def _edit_department(
+    db: Session,
+    user: dict,
+    ownership_service: OwnershipService,
+    departments_repository: DepartmentsRepository,
     department_id: int,
     edit_department_request: EditDepartmentRequest,
 ):
@@ -114,11 +207,36 @@ def edit_department(
     if edit_department_request.name:
         department.name = edit_department_request.name
 
-    db.commit()
+    db.flush()
+    ownership_service.invalidate(user["id"])
+    departments_repository.invalidate_department(department_id)
 
 
 @router.delete("/{department_id}")
-def delete_department(db: db_dependency, user: user_dependency, department_id: int):
+async def delete_department(
+    db: session_dependency,
+    user: user_dependency,
+    ownership_service: ownership_service_dependency,
+    departments_repository: departments_repository_dependency,
+    department_id: int,
+):
+    await run_db(
+        _delete_department,
+        db,
+        user,
+        ownership_service,
+        departments_repository,
+        department_id,
+    )
+
+
+def _delete_department(
+    db: Session,
+    user: dict,
+    ownership_service: OwnershipService,
+    departments_repository: DepartmentsRepository,
+    department_id: int,
+):
     department = db.query(models.Department).filter_by(id=department_id).first()
 
     if department is None:
@@ -137,4 +255,6 @@ def delete_department(db: db_dependency, user: user_dependency, department_id: i
     for employee in department_employees:
         db.delete(employee)
 
-    db.commit()
+    db.flush()
+    ownership_service.invalidate(user["id"])
+    departments_repository.invalidate_department(department_id)
@@ -1,7 +1,15 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.routing import APIRouter
 
-from server.api.dependenicies import user_dependency, employees_service_dependency
+from server.api.dependenicies import (
+    batch_ids_dependency,
+    employees_service_dependency,
+    entity_tag_dependency,
+    user_dependency,
+)
+from server.api.responses import json_response
+from server.database.database import run_db
+from server.schemas.batch import Batch
 from server.schemas.employees import CreateEmployeeRequest, Employee, CreatedEmployeeId
 from server.schemas.error import Error
 from server.services.employees_service import (
@@ -23,18 +31,23 @@ router = APIRouter(prefix="/employees", tags=["employees"])
     },
     response_model_exclude_none=True,
 )
-def get_employees_by_company(
+async def get_employees_by_company(
     employees_service: employees_service_dependency,
     user: user_dependency,
     company_id: int,
+    etag: entity_tag_dependency,
 ) -> list[Employee]:
     try:
-        return employees_service.get_employees_by_company(user["id"], company_id)
+        employees = await run_db(
+            employees_service.get_employees_by_company, user["id"], company_id
+        )
     except CompanyNotExistsError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Company does not exist")
     except ForbiddenError:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
 
+    return json_response(employees, exclude_none=True, headers={"ETag": etag})
+
 
 @router.get(
     "/department/{department_id}",
@@ -45,18 +58,41 @@ def get_employees_by_company(
     },
     response_model_exclude_none=True,
 )
-def get_employees_by_department(
+async def get_employees_by_department(
     employees_service: employees_service_dependency,
     user: user_dependency,
     department_id: int,
+    etag: entity_tag_dependency,
 ) -> list[Employee]:
     try:
-        return employees_service.get_employees_by_department(user["id"], department_id)
+        employees = await run_db(
+            employees_service.get_employees_by_department, user["id"], department_id
+        )
     except DepartmentNotExistsError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Department does not exist")
     except ForbiddenError:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
 
+    return json_response(employees, exclude_none=True, headers={"ETag": etag})
+
+
+@router.get(
+    "/batch",
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": Error},
+        status.HTTP_401_UNAUTHORIZED: {"model": Error},
+    },
+    response_model_exclude_none=True,
+)
+async def get_employees_by_ids(
+    employees_service: employees_service_dependency,
+    user: user_dependency,
+    ids: batch_ids_dependency,
+    etag: entity_tag_dependency,
+) -> Batch[Employee]:
+    employees = await run_db(employees_service.get_employees_by_ids, user["id"], ids)
+    return json_response(employees, exclude_none=True, headers={"ETag": etag})
+
 
 @router.get(
     "/{employee_id}",
@@ -67,19 +103,24 @@ def get_employees_by_department(
     },
     response_model_exclude_none=True,
 )
-def get_employee(
+async def get_employee(
     employees_service: employees_service_dependency,
     user: user_dependency,
     employee_id: int,
+    etag: entity_tag_dependency,
     include_actions: bool = False,
 ) -> Employee:
     try:
-        return employees_service.get_employee(user["id"], employee_id, include_actions)
+        employee = await run_db(
+            employees_service.get_employee, user["id"], employee_id, include_actions
+        )
     except EmployeeNotExistsError:
         raise HTTPException(status.HTTP_404_NOT_FOUND)
     except ForbiddenError:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
 
+    return json_response(employee, exclude_none=True, headers={"ETag": etag})
+
 
 @router.post(
     "/",
@@ -88,12 +129,14 @@ def get_employee(
     },
     status_code=status.HTTP_201_CREATED,
 )
-def create_employee(
+async def create_employee(
     employees_service: employees_service_dependency,
     user: user_dependency,
     create_employee_request: CreateEmployeeRequest,
 ) -> CreatedEmployeeId:
-    return employees_service.create_employee(user["id"], create_employee_request)
+    return await run_db(
+        employees_service.create_employee, user["id"], create_employee_request
+    )
 
 
 @router.put(
@@ -104,15 +147,18 @@ def create_employee(
         status.HTTP_401_UNAUTHORIZED: {"model": Error},
     },
 )
-def edit_employee(
+async def edit_employee(
     employees_service: employees_service_dependency,
     user: user_dependency,
     employee_id: int,
     create_employee_request: CreateEmployeeRequest,
 ):
     try:
-        employees_service.update_employee(
-            user["id"], employee_id, create_employee_request
+        await run_db(
+            employees_service.update_employee,
+            user["id"],
+            employee_id,
+            create_employee_request,
         )
     except EmployeeNotExistsError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Employee does not exist")
@@ -128,13 +174,13 @@ def edit_employee(
         status.HTTP_401_UNAUTHORIZED: {"model": Error},
     },
 )
-def delete_employee(
+async def delete_employee(
     employees_service: employees_service_dependency,
     user: user_dependency,
     employee_id: int,
 ):
     try:
-        employees_service.delete_employee(user["id"], employee_id)
+        await run_db(employees_service.delete_employee, user["id"], employee_id)
     except EmployeeNotExistsError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Employee does not exist")
     except ForbiddenError:
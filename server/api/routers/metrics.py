@@ -0,0 +1,168 @@
+from collections.abc import Sized
+
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRouter
+from sqlalchemy.pool import Pool
+
+from server.api.dependenicies import (
+    access_token_cache,
+    auth_email_rate_limiter,
+    auth_ip_rate_limiter,
+    entity_cache,
+    ownership_cache,
+)
+from server.database.database import (
+    async_engine,
+    async_read_engine,
+    engine,
+    read_engine,
+)
+from server.metrics.metrics import (
+    http_request_duration,
+    http_requests_in_progress,
+    report_duration,
+)
+from server.metrics.prometheus import render
+from server.model.auth.password_hasher import get_password_hasher
+
+router = APIRouter(tags=["metrics"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    lines = [
+        *http_request_duration.collect(),
+        *http_requests_in_progress.collect(),
+        *report_duration.collect(),
+        *_pool_metrics(),
+        *render(
+            "password_hashing_queue_depth",
+            "gauge",
+            "Password hashing jobs running or waiting for a worker.",
+            [({}, get_password_hasher().queue_depth)],
+        ),
+        *_cache_metrics(),
+        *_rate_limiter_metrics(),
+    ]
+    return PlainTextResponse("\n".join(lines) + "\n", media_type=CONTENT_TYPE)
+
+
+def _pool_metrics() -> list[str]:
+    pools: dict[str, Pool] = {"primary": (async_engine or engine).pool}
+    replica = async_read_engine or read_engine
+
+    if replica is not None:
+        pools["replica"] = replica.pool
+
+    def samples(value) -> list:
+        return [({"pool": name}, value(pool)) for name, pool in pools.items()]
+
+    return [
+        *render(
+            "db_pool_size",
+            "gauge",
+            "Configured number of pooled connections.",
+            samples(lambda pool: pool.size()),
+        ),
+        *render(
+            "db_pool_checked_out",
+            "gauge",
+            "Connections currently checked out of the pool.",
+            samples(lambda pool: pool.checkedout()),
+        ),
+        *render(
+            "db_pool_overflow",
+            "gauge",
+            "Connections open beyond the pool size.",
+            samples(lambda pool: pool.overflow()),
+        ),
+        *render(
+            "db_pool_checkouts_total",
+            "counter",
+            "Connection checkouts.",
+            samples(lambda pool: pool.checkouts),
+        ),
+        *render(
+            "db_pool_timeouts_total",
+            "counter",
+            "Checkouts that timed out waiting for a connection.",
+            samples(lambda pool: pool.timeouts),
+        ),
+        *render(
+            "db_pool_checkout_seconds_total",
+            "counter",
+            "Time spent waiting for connections.",
+            samples(lambda pool: pool.checkout_time),
+        ),
+        *render(
+            "db_pool_max_checkout_seconds",
+            "gauge",
+            "Longest wait for a connection.",
+            samples(lambda pool: pool.max_checkout_time),
+        ),
+    ]
+
+
+def _cache_metrics() -> list[str]:
+    caches = {
+        ("access_token", "lru"): access_token_cache,
+        ("ownership", "lru"): ownership_cache,
+        ("entity", entity_cache.name): entity_cache,
+    }
+
+    def samples(value, caches=caches) -> list:
+        return [
+            ({"cache": name, "backend": backend}, value(cache))
+            for (name, backend), cache in caches.items()
+        ]
+
+    return [
+        *render(
+            "cache_hits_total",
+            "counter",
+            "Cache lookups that found an entry.",
+            samples(lambda cache: cache.hits),
+        ),
+        *render(
+            "cache_misses_total",
+            "counter",
+            "Cache lookups that found no entry.",
+            samples(lambda cache: cache.misses),
+        ),
+        *render(
+            "cache_hit_ratio",
+            "gauge",
+            "Share of cache lookups that found an entry since startup.",
+            samples(lambda cache: cache.hits / (cache.hits + cache.misses or 1)),
+        ),
+        *render(
+            "cache_entries",
+            "gauge",
+            "Entries currently held in the in-process caches.",
+            samples(
+                len,
+                {
+                    key: cache
+                    for key, cache in caches.items()
+                    if isinstance(cache, Sized)
+                },
+            ),
+        ),
+    ]
+
+
+def _rate_limiter_metrics() -> list[str]:
+    limiters = {"ip": auth_ip_rate_limiter, "email": auth_email_rate_limiter}
+
+    return render(
+        "auth_rate_limiter_requests_total",
+        "counter",
+        "Authentication attempts checked by the rate limiters.",
+        [
+            ({"limiter": name, "result": result}, getattr(limiter, result))
+            for name, limiter in limiters.items()
+            for result in ("allowed", "limited")
+        ],
+    )
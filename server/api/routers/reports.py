@@ -1,21 +1,36 @@
+import time
+
 from fastapi import HTTPException, status
 from fastapi.responses import Response
 from fastapi.routing import APIRouter
+from starlette.concurrency import run_in_threadpool
 
 from server.services.reports_service import CompanyNotExistsError, ForbiddenError
 from server.api.dependenicies import user_dependency, reports_service_dependency
+from server.database.database import run_db
+from server.metrics.metrics import report_duration
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
 @router.get("/company/{company_id}")
-def generate_report(
+async def generate_report(
     reports_service: reports_service_dependency, user: user_dependency, company_id: int
 ):
+    started = time.perf_counter()
+
     try:
-        report = reports_service.generate_report(user["id"], company_id)
+        report_data = await run_db(
+            reports_service.get_report_data, user["id"], company_id
+        )
     except CompanyNotExistsError:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Company does not exist")
     except ForbiddenError:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
+
+    rendering_started = time.perf_counter()
+    report_duration.observe(rendering_started - started, "data")
+
+    report = await run_in_threadpool(reports_service.render_report, report_data)
+    report_duration.observe(time.perf_counter() - rendering_started, "render")
     return Response(content=report, media_type="application/pdf")
@@ -0,0 +1,46 @@
+from fastapi import HTTPException, Request, status
+from fastapi.routing import APIRouter
+from sqlalchemy.pool import Pool
+
+from server.database.database import (
+    async_engine,
+    async_read_engine,
+    engine,
+    read_engine,
+)
+from server.schemas.status import DatabasePoolStatus, StartupStatus
+
+router = APIRouter(prefix="/status", tags=["status"])
+
+
+@router.get("/database")
+def get_database_status() -> DatabasePoolStatus:
+    return _pool_status((async_engine or engine).pool)
+
+
+@router.get("/database/replica")
+def get_database_replica_status() -> DatabasePoolStatus:
+    replica = async_read_engine or read_engine
+
+    if replica is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "No read replica configured")
+
+    return _pool_status(replica.pool)
+
+
+@router.get("/startup")
+def get_startup_status(request: Request) -> StartupStatus:
+    return StartupStatus(startup_time=request.app.state.startup_time)
+
+
+def _pool_status(pool: Pool) -> DatabasePoolStatus:
+    return DatabasePoolStatus(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=pool.overflow(),
+        checkouts=pool.checkouts,
+        timeouts=pool.timeouts,
+        checkout_time=pool.checkout_time,
+        max_checkout_time=pool.max_checkout_time,
+    )
@@ -0,0 +1,61 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from server.tracing.tracer import current_span, get_tracer
+
+
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        tracer = get_tracer()
+        traceparent = next(
+            (
+                value.decode("latin-1")
+                for name, value in scope["headers"]
+                if name == b"traceparent"
+            ),
+            None,
+        )
+        span = tracer.start_trace(
+            scope["method"],
+            traceparent=traceparent,
+            **{"http.method": scope["method"], "url.path": scope["path"]},
+        )
+
+        if span is None:
+            await self._app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        token = current_span.set(span)
+        error = None
+
+        try:
+            await self._app(scope, receive, send_with_status)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            current_span.reset(token)
+            route = scope.get("route")
+
+            if route is not None:
+                span.name = f"{scope['method']} {route.path}"
+                span.attributes["http.route"] = route.path
+
+            span.attributes["http.status_code"] = status
+            tracer.end_span(span, error)
@@ -0,0 +1,16 @@
+from typing import Any, Protocol
+
+
+class CacheBackend(Protocol):
+    name: str
+    hits: int
+    misses: int
+
+    def get(self, key: str) -> Any:
+        pass
+
+    def put(self, key: str, value: Any) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
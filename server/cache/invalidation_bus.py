@@ -0,0 +1,109 @@
+import json
+import logging
+import select
+import uuid
+from threading import Event, Thread
+from typing import Any, Callable, Hashable, Iterable
+
+from sqlalchemy import Engine, func
+from sqlalchemy import select as sql_select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+
+
+class InvalidationBus:
+    def __init__(self, engine: Engine, reconnect_interval: float = 5):
+        self._engine = engine
+        self._reconnect_interval = reconnect_interval
+        self._origin = uuid.uuid4().hex
+        self._evictors: dict[str, Callable[[list[Hashable]], None]] = {}
+        self._clearers: dict[str, Callable[[], None]] = {}
+        self._stopped = Event()
+        self._thread = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._engine.dialect.name == "postgresql"
+
+    def register(
+        self,
+        cache: str,
+        evict: Callable[[list[Hashable]], None],
+        clear: Callable[[], None],
+    ) -> None:
+        self._evictors[cache] = evict
+        self._clearers[cache] = clear
+
+    def publish(self, db: Session, cache: str, keys: Iterable[Hashable]) -> None:
+        if db.bind is None or db.bind.dialect.name != "postgresql":
+            return
+
+        payload = json.dumps(
+            {"origin": self._origin, "cache": cache, "keys": list(keys)}
+        )
+        db.execute(sql_select(func.pg_notify(CHANNEL, payload)))
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+
+        self._stopped.clear()
+        self._thread = Thread(
+            target=self._run, name="cache-invalidation-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def handle(self, payload: str) -> None:
+        try:
+            message: dict[str, Any] = json.loads(payload)
+            evict = self._evictors.get(message["cache"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed cache invalidation %r", payload)
+            return
+
+        if evict is not None and message.get("origin") != self._origin:
+            evict(message.get("keys", []))
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Cache invalidation listener failed, reconnecting")
+
+            self._stopped.wait(self._reconnect_interval)
+
+    def _listen(self) -> None:
+        cargs, cparams = self._engine.dialect.create_connect_args(self._engine.url)
+        connection = self._engine.dialect.connect(*cargs, **cparams)
+
+        try:
+            connection.autocommit = True
+
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+
+            # Notifications sent while disconnected are lost.
+            for clear in self._clearers.values():
+                clear()
+
+            while not self._stopped.is_set():
+                if not select.select([connection], [], [], 1)[0]:
+                    continue
+
+                connection.poll()
+
+                while connection.notifies:
+                    self.handle(connection.notifies.pop(0).payload)
+        finally:
+            connection.close()
@@ -0,0 +1,35 @@
+from typing import Any
+
+from .cache_backend import CacheBackend
+from .lru_cache import LRUCache
+
+
+class LRUCacheBackend(CacheBackend):
+    name = "lru"
+
+    def __init__(self, cache: LRUCache):
+        self._cache = cache
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, key: str) -> Any:
+        return self._cache.get(key)
+
+    def put(self, key: str, value: Any) -> None:
+        self._cache.put(key, value)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
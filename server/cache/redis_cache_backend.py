@@ -0,0 +1,48 @@
+import json
+import logging
+from typing import Any
+
+from redis import Redis, RedisError
+
+from .cache_backend import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCacheBackend(CacheBackend):
+    name = "redis"
+
+    def __init__(self, client: Redis, ttl: float, prefix: str = ""):
+        self._client = client
+        self._ttl = ttl
+        self._prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        try:
+            value = self._client.get(self._prefix + key)
+        except RedisError:
+            logger.warning("Cache lookup of %s failed", key, exc_info=True)
+            value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(value)
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            self._client.set(
+                self._prefix + key, json.dumps(value), px=int(self._ttl * 1000)
+            )
+        except RedisError:
+            logger.warning("Cache update of %s failed", key, exc_info=True)
+
+    def delete(self, *keys: str) -> None:
+        try:
+            self._client.delete(*(self._prefix + key for key in keys))
+        except RedisError:
+            logger.exception("Cache invalidation of %s failed", ", ".join(keys))
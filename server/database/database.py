@@ -1,38 +1,179 @@
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from os import environ
-from typing import Annotated
-from fastapi import Depends
-from sqlalchemy import URL, StaticPool, create_engine
+from typing import Any, AsyncIterator, Callable, Iterator, TypeVar, cast
+from sqlalchemy import URL, Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.util import greenlet_spawn
+from starlette.concurrency import run_in_threadpool
 
 
 from ..settings import get_settings
+from .pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
 
+T = TypeVar("T")
 
-url = URL.create(
-    "postgresql",
-    get_settings().postgres_username,
-    get_settings().postgres_password,
-    get_settings().postgres_host,
-    get_settings().postgres_port,
-)
 
-engine = create_engine(
-    url, connect_args={}, poolclass=StaticPool, echo=True
+url = (
+    make_url(get_settings().database_url)
+    if get_settings().database_url
+    else URL.create(
+        "postgresql",
+        get_settings().postgres_username,
+        get_settings().postgres_password,
+        get_settings().postgres_host,
+        get_settings().postgres_port,
+    )
+)
+read_url = (
+    make_url(get_settings().database_read_url)
+    if get_settings().database_read_url
+    else None
 )
 
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def _pool_options() -> dict:
+    return dict(
+        pool_size=get_settings().db_pool_size,
+        max_overflow=get_settings().db_max_overflow,
+        pool_timeout=get_settings().db_pool_timeout,
+        pool_pre_ping=get_settings().db_pool_pre_ping,
+        pool_recycle=get_settings().db_pool_recycle,
+        echo=get_settings().db_echo,
+    )
+
+
+def _create_engine(url: URL) -> Engine:
+    return create_engine(url, poolclass=InstrumentedQueuePool, **_pool_options())
+
+
+def _create_async_engine(url: URL) -> AsyncEngine:
+    backend = url.get_backend_name()
+    return create_async_engine(
+        url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}"),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        **_pool_options(),
+    )
+
+
+engine = _create_engine(url)
+read_engine = _create_engine(read_url) if read_url else None
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    if read_engine
+    else None
+)
+
+if get_settings().db_async:
+    async_engine = _create_async_engine(url)
+    async_read_engine = _create_async_engine(read_url) if read_url else None
+    AsyncSessionLocal = async_sessionmaker(
+        autocommit=False, autoflush=False, bind=async_engine
+    )
+    AsyncReadSessionLocal = (
+        async_sessionmaker(autocommit=False, autoflush=False, bind=async_read_engine)
+        if async_read_engine
+        else None
+    )
+else:
+    async_engine = None
+    async_read_engine = None
+    AsyncSessionLocal = None
+    AsyncReadSessionLocal = None
 
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
+current_session: ContextVar[Session] = ContextVar("current_session")
+
+
+class RequestSession:
+    def __getattr__(self, name: str) -> Any:
+        return getattr(current_session.get(), name)
+
+
+# Lets repositories be built once and still use the session of the request
+# being handled.
+request_session = cast(Session, RequestSession())
+
+
+def _resolve(db: Session) -> Session:
+    return current_session.get() if isinstance(db, RequestSession) else db
+
+
+@contextmanager
+def _bind(db: Session) -> Iterator[None]:
+    token = current_session.set(db)
+
+    try:
+        yield
+    finally:
+        current_session.reset(token)
+
+
+@asynccontextmanager
+async def session_scope(read_only: bool = False) -> AsyncIterator[Session]:
+    replica = read_only and read_url is not None
+
+    if get_settings().db_async:
+        async with (AsyncReadSessionLocal if replica else AsyncSessionLocal)() as db:
+            with _bind(db.sync_session):
+                yield db.sync_session
+
+                if not replica:
+                    await db.commit()
+        return
+
+    db = (ReadSessionLocal if replica else SessionLocal)()
 
     try:
-        yield db
+        with _bind(db):
+            yield db
+
+            if not replica:
+                await run_in_threadpool(db.commit)
     finally:
-        db.close()
+        await run_in_threadpool(db.close)
+
+
+def on_transaction_end(db: Session, callback: Callable[[], None]) -> None:
+    called = False
+
+    def listener(session: Session, transaction) -> None:
+        nonlocal called
+
+        # Flushes and savepoints end subtransactions of their own, only run
+        # once the outermost transaction commits or rolls back.
+        if called or transaction.parent is not None:
+            return
+
+        called = True
+        callback()
+
+    event.listen(_resolve(db), "after_transaction_end", listener)
+
+
+def is_read_replica(db: Session) -> bool:
+    replicas = (read_engine, async_read_engine and async_read_engine.sync_engine)
+    bind = _resolve(db).bind
+    return bind is not None and bind in replicas
+
+
+def before_commit(db: Session, callback: Callable[[], None]) -> None:
+    event.listen(_resolve(db), "before_commit", lambda session: callback(), once=True)
 
 
-db_dependency = Annotated[Session, Depends(get_db)]
+async def run_db(fn: Callable[..., T], *args, **kwargs) -> T:
+    if get_settings().db_async:
+        return await greenlet_spawn(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, *args, **kwargs)
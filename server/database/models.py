@@ -1,6 +1,15 @@
 import datetime
 from .database import Base
-from sqlalchemy import String, ForeignKey, Date, Float, Date, DateTime, Enum as SQLEnum
+from sqlalchemy import (
+    String,
+    ForeignKey,
+    Date,
+    Float,
+    Date,
+    DateTime,
+    Enum as SQLEnum,
+    Index,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from enum import Enum
 
@@ -11,6 +20,7 @@ class User(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     email: Mapped[str] = mapped_column(String(30), unique=True)
     password_hash: Mapped[str] = mapped_column(String())
+    data_version: Mapped[int] = mapped_column(default=0, server_default="0")
     companies: Mapped[list["Company"]] = relationship(
         "Company", cascade="all,delete", back_populates="owner"
     )
@@ -26,16 +36,11 @@ class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
     id: Mapped[int] = mapped_column(primary_key=1)
-    token_hash: Mapped[str] = mapped_column(String())
-    expires: Mapped[datetime.datetime] = mapped_column(DateTime())
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    token_hash: Mapped[str] = mapped_column(String(), unique=True, index=True)
+    expires: Mapped[datetime.datetime] = mapped_column(DateTime(), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
     user: Mapped["User"] = relationship(back_populates="refresh_tokens")
 
-    @classmethod
-    def delete_expired_tokens(cls, db):
-        db.query(cls).filter(datetime.datetime.now() > cls.expires).delete()
-        db.commit()
-
 
 class Company(Base):
     __tablename__ = "companies"
@@ -44,7 +49,7 @@ class Company(Base):
     name: Mapped[str] = mapped_column(String())
     inn: Mapped[str] = mapped_column(String(10))
     kpp: Mapped[str] = mapped_column(String(9))
-    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
     owner: Mapped["User"] = relationship("User", back_populates="companies")
     departments: Mapped[list["Department"]] = relationship(
         "Department", cascade="all,delete", back_populates="company"
@@ -56,7 +61,7 @@ class Department(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String())
-    company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"))
+    company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"), index=True)
     company: Mapped["Company"] = relationship("Company", back_populates="departments")
 
 
@@ -81,7 +86,7 @@ class Employee(Base):
     actions: Mapped[list["Action"]] = relationship(
         "Action", cascade="all,delete", back_populates="employee"
     )
-    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
     owner: Mapped["User"] = relationship("User", back_populates="employees")
 
     @property
@@ -191,15 +196,16 @@ class Action(Base):
     action_type = mapped_column(String(32), nullable=False)
     employee_id: Mapped[int] = mapped_column(ForeignKey("employees.id"))
     employee: Mapped["Employee"] = relationship("Employee", back_populates="actions")
-    date: Mapped[datetime.date] = mapped_column(Date(), nullable=True)
+    date: Mapped[datetime.date] = mapped_column(Date(), nullable=True, index=True)
     __mapper_args__ = {"polymorphic_on": action_type}
+    __table_args__ = (Index("ix_actions_employee_id_date", employee_id, date),)
 
 
 class RecruitmentAction(Action):
     __mapper_args__ = {"polymorphic_identity": "recruitment"}
 
     department_id: Mapped[int] = mapped_column(
-        ForeignKey("departments.id"), nullable=True
+        ForeignKey("departments.id"), nullable=True, index=True
     )
     department: Mapped["Department"] = relationship(foreign_keys=[department_id])
     position: Mapped[str] = mapped_column(String(), nullable=True)
@@ -216,7 +222,7 @@ class DepartmentTransferAction(Action):
     __mapper_args__ = {"polymorphic_identity": "department_transfer"}
 
     new_department_id: Mapped[int] = mapped_column(
-        ForeignKey("departments.id"), nullable=True
+        ForeignKey("departments.id"), nullable=True, index=True
     )
     new_department: Mapped["Department"] = relationship(
         foreign_keys=[new_department_id]
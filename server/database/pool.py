@@ -0,0 +1,40 @@
+import time
+from threading import Lock
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+
+class _CheckoutStats:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.checkout_time = 0.0
+        self.max_checkout_time = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+
+            with self._stats_lock:
+                self.checkouts += 1
+                self.checkout_time += elapsed
+                self.max_checkout_time = max(self.max_checkout_time, elapsed)
+
+
+class InstrumentedQueuePool(_CheckoutStats, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_CheckoutStats, AsyncAdaptedQueuePool):
+    pass
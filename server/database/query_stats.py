@@ -0,0 +1,82 @@
+import os
+import sys
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+
+SERVER_PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPOSITORY_PACKAGE = os.path.join(SERVER_PACKAGE, "repo", "")
+
+
+@dataclass
+class QueryStats:
+    track_statements: bool = False
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+    origins: dict[str, str | None] = field(default_factory=dict)
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int, str | None]]:
+        return [
+            (statement, count, self.origins.get(statement))
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def instrument_engines() -> None:
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats.get()
+
+    if stats is None or context is None:
+        return
+
+    context.query_started = time.perf_counter()
+
+    if stats.track_statements:
+        stats.statements[statement] += 1
+
+        if statement not in stats.origins:
+            stats.origins[statement] = _caller()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats.get()
+
+    if stats is None or context is None:
+        return
+
+    stats.count += 1
+    stats.duration += time.perf_counter() - context.query_started
+
+
+def _caller() -> str | None:
+    frame = sys._getframe(2)
+    innermost = None
+
+    while frame is not None:
+        filename = frame.f_code.co_filename
+
+        if filename.startswith(SERVER_PACKAGE) and filename != __file__:
+            path = os.path.relpath(filename, SERVER_PACKAGE)
+            location = f"{path}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+            if filename.startswith(REPOSITORY_PACKAGE):
+                return location
+
+            innermost = innermost or location
+
+        frame = frame.f_back
+
+    return innermost
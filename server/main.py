@@ -1,19 +1,87 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from .api.routers import (
+    actions,
+    auth,
+    companies,
+    departments,
+    employees,
+    metrics,
+    reports,
+    status,
+)
+
+from .api.compression_middleware import CompressionMiddleware
+from .api.dependenicies import invalidation_bus
+from .api.metrics_middleware import MetricsMiddleware
+from .api.query_stats_middleware import QueryStatsMiddleware
+from .api.tracing_middleware import TracingMiddleware
+from .database.database import Base, SessionLocal, engine
+from .database.query_stats import instrument_engines
+from .services.auth.refresh_token_sweeper import RefreshTokenSweeper
+from .settings import get_settings
+from .tracing.setup import create_tracer
+from .tracing.tracer import get_tracer, set_tracer, trace_engines
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if get_settings().db_create_schema:
+        await run_in_threadpool(Base.metadata.create_all, engine)
+
+    refresh_token_sweeper = RefreshTokenSweeper(
+        SessionLocal,
+        get_settings().refresh_token_sweep_interval,
+        get_settings().refresh_token_sweep_batch_size,
+    )
+    refresh_token_sweeper.start()
+
+    if get_settings().cache_invalidation_listen:
+        invalidation_bus.start()
 
-from .api.routers import actions, auth, companies, departments, employees, reports
+    app.state.startup_time = time.perf_counter() - app.state.created_at
+    logger.info("Application startup took %.3fs", app.state.startup_time)
 
-from .database.database import engine, Base
+    yield
+    refresh_token_sweeper.stop()
+    invalidation_bus.stop()
+    get_tracer().shutdown()
 
-Base.metadata.create_all(engine)
 
-app = FastAPI()
-app.include_router(auth.router)
-app.include_router(companies.router)
-app.include_router(departments.router)
-app.include_router(employees.router)
-app.include_router(actions.router)
-app.include_router(reports.router)
+def create_app() -> FastAPI:
+    created_at = time.perf_counter()
 
+    instrument_engines()
+    set_tracer(create_tracer())
+    trace_engines()
 
-Base.metadata.create_all(bind=engine)
+    app = FastAPI(lifespan=lifespan)
+    app.state.created_at = created_at
+    app.add_middleware(
+        QueryStatsMiddleware,
+        detect_n_plus_one=get_settings().detect_n_plus_one,
+        n_plus_one_threshold=get_settings().n_plus_one_threshold,
+    )
+    app.add_middleware(TracingMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=get_settings().compression_minimum_size,
+        encodings=get_settings().compression_encodings,
+    )
+    app.include_router(auth.router)
+    app.include_router(companies.router)
+    app.include_router(departments.router)
+    app.include_router(employees.router)
+    app.include_router(actions.router)
+    app.include_router(reports.router)
+    app.include_router(status.router)
+    app.include_router(metrics.router)
+    return app
@@ -0,0 +1,16 @@
+from .prometheus import Gauge, Histogram
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests.",
+    ("method", "route", "status"),
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress", "HTTP requests currently being handled."
+)
+report_duration = Histogram(
+    "report_duration_seconds",
+    "Time spent building company reports.",
+    ("stage",),
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
@@ -0,0 +1,113 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Iterable
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+Sample = tuple[dict[str, str], float]
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(
+    name: str, kind: str, documentation: str, samples: Iterable[Sample]
+) -> list[str]:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    lines.extend(
+        f"{name}{_format_labels(labels)} {_format_value(value)}"
+        for labels, value in samples
+    )
+    return lines
+
+
+class Gauge:
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self.value = 0
+        self._lock = Lock()
+
+    def inc(self) -> None:
+        with self._lock:
+            self.value += 1
+
+    def dec(self) -> None:
+        with self._lock:
+            self.value -= 1
+
+    def collect(self) -> list[str]:
+        return render(self.name, "gauge", self.documentation, [({}, self.value)])
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self._labelnames = labelnames
+        self._buckets = buckets
+        self._series: dict[tuple[str, ...], list] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self._buckets, value)
+
+        with self._lock:
+            series = self._series.get(labels)
+
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self._buckets) + 1), 0.0]
+
+            series[0][index] += 1
+            series[1] += value
+
+    def collect(self) -> list[str]:
+        with self._lock:
+            series = [
+                (labels, list(counts), total)
+                for labels, (counts, total) in self._series.items()
+            ]
+
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+
+        for labels, counts, total in series:
+            label_map = dict(zip(self._labelnames, labels))
+            cumulative = 0
+
+            for bound, count in zip(self._buckets + (float("inf"),), counts):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    {**label_map, "le": _format_value(float(bound))}
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+
+            lines.append(f"{self.name}_sum{_format_labels(label_map)} {total!r}")
+            lines.append(f"{self.name}_count{_format_labels(label_map)} {cumulative}")
+
+        return lines
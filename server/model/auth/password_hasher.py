@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+from threading import Lock
+
+from passlib.context import CryptContext
+
+from server.settings import get_settings
+
+
+class PasswordHasherBusyError(Exception):
+    pass
+
+
+class PasswordHasher:
+    def __init__(self, rounds: int, workers: int, queue_size: int):
+        self._context = CryptContext(
+            schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hasher"
+        )
+        self._capacity = workers + queue_size
+        self._pending = 0
+        self._lock = Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        return await asyncio.wrap_future(self._submit(self._context.hash, password))
+
+    async def verify_and_update(
+        self, password: str, password_hash: str
+    ) -> tuple[bool, str | None]:
+        return await asyncio.wrap_future(
+            self._submit(self._context.verify_and_update, password, password_hash)
+        )
+
+    def _submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._pending >= self._capacity:
+                raise PasswordHasherBusyError()
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+@cache
+def get_password_hasher() -> PasswordHasher:
+    settings = get_settings()
+    return PasswordHasher(
+        settings.bcrypt_rounds,
+        settings.password_hashing_workers,
+        settings.password_hashing_queue_size,
+    )
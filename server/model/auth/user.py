@@ -1,5 +1,6 @@
-from dataclasses import dataclass, field
-from passlib.context import CryptContext
+from dataclasses import dataclass
+
+from .password_hasher import get_password_hasher
 
 
 @dataclass
@@ -9,12 +10,17 @@ class User:
     id: int = None
 
     @classmethod
-    def new(cls, email: str, password: str) -> "User":
-        bcrypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        password_hash = bcrypt_context.hash(password)
+    async def new(cls, email: str, password: str) -> "User":
+        password_hash = await get_password_hasher().hash(password)
 
         return cls(email=email, password_hash=password_hash)
 
-    def validate_password(self, password: str) -> bool:
-        bcrypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        return bcrypt_context.verify(password, self.password_hash)
+    async def validate_password(self, password: str) -> bool:
+        valid, new_password_hash = await get_password_hasher().verify_and_update(
+            password, self.password_hash
+        )
+
+        if new_password_hash:
+            self.password_hash = new_password_hash
+
+        return valid
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Ownership:
+    company_ids: frozenset[int]
+    department_ids: frozenset[int]
+    employee_ids: frozenset[int]
@@ -7,6 +7,11 @@ class ActionsRepository(Protocol):
     def get_actions(self, employee_id: int) -> Iterable[Action]:
         pass
 
+    def get_actions_by_employee_ids(
+        self, employee_ids: list[int]
+    ) -> dict[int, list[Action]]:
+        pass
+
     def get_action(self, action_id: int) -> Action:
         pass
 
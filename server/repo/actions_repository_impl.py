@@ -1,6 +1,6 @@
 from typing import Iterable
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, with_polymorphic
 
 from server.model.action import *
 from server.database.models import (
@@ -105,6 +105,22 @@ class ActionsRepositoryImpl(ActionsRepository):
         )
         return [db_action_to_action(db_action) for db_action in db_actions]
 
+    def get_actions_by_employee_ids(
+        self, employee_ids: list[int]
+    ) -> dict[int, list[Action]]:
+        db_actions = (
+            self._db.query(with_polymorphic(DbAction, "*"))
+            .filter(DbAction.employee_id.in_(employee_ids))
+            .order_by(DbAction.date)
+            .all()
+        )
+        actions = {employee_id: [] for employee_id in employee_ids}
+
+        for db_action in db_actions:
+            actions[db_action.employee_id].append(db_action_to_action(db_action))
+
+        return actions
+
     def get_action(self, action_id: int) -> Action:
         db_action = self._db.query(DbAction).filter_by(id=action_id).one_or_none()
         return db_action_to_action(db_action)
@@ -112,14 +128,14 @@ class ActionsRepositoryImpl(ActionsRepository):
     def add_action(self, action: Action):
         db_action = action_to_db_action(action)
         self._db.add(db_action)
-        self._db.commit()
+        self._db.flush()
 
     def update_action(self, new_action: Action):
         self._db.query(DbAction).filter_by(id=new_action.id).delete()
         db_action = action_to_db_action(new_action)
         self._db.add(db_action)
-        self._db.commit()
+        self._db.flush()
 
     def delete_action(self, action_id: int):
         self._db.query(DbAction).filter_by(id=action_id).delete()
-        self._db.commit()
+        self._db.flush()
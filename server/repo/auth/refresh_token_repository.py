@@ -16,3 +16,6 @@ class RefreshTokenRepository:
 
     def delete_refresh_token(self, token: str) -> None:
         pass
+
+    def delete_expired_refresh_tokens(self, limit: int) -> int:
+        pass
@@ -1,5 +1,6 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 from uuid import uuid4
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from server.model.auth.refresh_token import RefreshToken
@@ -17,13 +18,14 @@ class RefreshTokenRepositoryImpl:
             token_hash=token.token_hash, expires=token.expires, user_id=token.user_id
         )
         self._db.add(db_token)
-        self._db.commit()
+        self._db.flush()
         return refresh_token
 
     def get_refresh_token(self, token: str) -> RefreshToken:
         db_token = (
             self._db.query(DbRefreshToken)
             .filter_by(token_hash=RefreshToken.hash_token(token))
+            .filter(DbRefreshToken.expires > datetime.now())
             .one_or_none()
         )
 
@@ -42,4 +44,19 @@ class RefreshTokenRepositoryImpl:
         self._db.query(DbRefreshToken).filter_by(
             token_hash=RefreshToken.hash_token(token)
         ).delete()
-        self._db.commit()
+        self._db.flush()
+
+    def delete_expired_refresh_tokens(self, limit: int) -> int:
+        expired_ids = (
+            select(DbRefreshToken.id)
+            .filter(DbRefreshToken.expires <= datetime.now())
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = self._db.execute(
+            delete(DbRefreshToken)
+            .filter(DbRefreshToken.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        )
+        self._db.flush()
+        return result.rowcount
@@ -13,5 +13,8 @@ class UserRepository(Protocol):
     def find_user_by_email(self, email: str) -> User:
         pass
 
+    def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        pass
+
     def delete_user(self, user_id: int) -> None:
         pass
@@ -11,7 +11,7 @@ class UserRepositoryImpl:
     def create_user(self, email: str, password_hash: str) -> int:
         db_user = DbUser(email=email, password_hash=password_hash)
         self._db.add(db_user)
-        self._db.commit()
+        self._db.flush()
         return db_user
 
     def get_user(self, user_id: int):
@@ -27,6 +27,12 @@ class UserRepositoryImpl:
             id=db_user.id, email=db_user.email, password_hash=db_user.password_hash
         )
 
+    def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        self._db.query(DbUser).filter_by(id=user_id).update(
+            {DbUser.password_hash: password_hash}
+        )
+        self._db.flush()
+
     def delete_user(self, user_id: int):
         self._db.query(DbUser).filter_by(id=user_id).delete()
-        self._db.commit()
+        self._db.flush()
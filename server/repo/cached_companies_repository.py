@@ -0,0 +1,75 @@
+from dataclasses import asdict
+from typing import Callable, Iterable
+
+from server.cache.cache_backend import CacheBackend
+from server.model.company import Company
+from .companies_repository import CompaniesRepository
+
+
+class CachedCompaniesRepository(CompaniesRepository):
+    def __init__(
+        self,
+        companies_repository: CompaniesRepository,
+        cache: CacheBackend,
+        on_transaction_end: Callable[[Callable[[], None]], None],
+        publish_invalidation: Callable[[list[str]], None],
+        populate_cache: Callable[[], bool] = lambda: True,
+    ):
+        self._repository = companies_repository
+        self._cache = cache
+        self._on_transaction_end = on_transaction_end
+        self._publish_invalidation = publish_invalidation
+        self._populate_cache = populate_cache
+
+    def get_companies(self, user_id: int) -> Iterable[Company]:
+        return self._repository.get_companies(user_id)
+
+    def get_company(self, company_id: int) -> Company:
+        key = f"company:{company_id}"
+        cached = self._cache.get(key)
+
+        if cached is not None:
+            return Company(**cached)
+
+        company = self._repository.get_company(company_id)
+
+        if company is not None and self._populate_cache():
+            self._cache.put(key, asdict(company))
+
+        return company
+
+    def get_companies_by_ids(self, company_ids: list[int]) -> list[Company]:
+        return self._repository.get_companies_by_ids(company_ids)
+
+    def create_company(
+        self,
+        name: str,
+        inn: str,
+        kpp: str,
+        owner_id: int,
+    ) -> int:
+        return self._repository.create_company(name, inn, kpp, owner_id)
+
+    def edit_company(
+        self,
+        company_id: int,
+        *,
+        name: str = None,
+        inn: str = None,
+        kpp: str = None,
+        owner_id: int = None,
+    ) -> None:
+        self._repository.edit_company(
+            company_id, name=name, inn=inn, kpp=kpp, owner_id=owner_id
+        )
+        self._invalidate(company_id)
+
+    def delete_company(self, company_id: int) -> None:
+        self._repository.delete_company(company_id)
+        self._invalidate(company_id)
+
+    def _invalidate(self, company_id: int) -> None:
+        key = f"company:{company_id}"
+        self._cache.delete(key)
+        self._on_transaction_end(lambda: self._cache.delete(key))
+        self._publish_invalidation([key])
@@ -0,0 +1,64 @@
+from typing import Callable
+
+from server.cache.cache_backend import CacheBackend
+from server.model.department import Department
+from .companies_repository import CompaniesRepository
+from .departments_repository import DepartmentsRepository
+
+
+class CachedDepartmentsRepository(DepartmentsRepository):
+    def __init__(
+        self,
+        departments_repository: DepartmentsRepository,
+        companies_repository: CompaniesRepository,
+        cache: CacheBackend,
+        on_transaction_end: Callable[[Callable[[], None]], None],
+        publish_invalidation: Callable[[list[str]], None],
+        populate_cache: Callable[[], bool] = lambda: True,
+    ):
+        self._repository = departments_repository
+        self._companies_repository = companies_repository
+        self._cache = cache
+        self._on_transaction_end = on_transaction_end
+        self._publish_invalidation = publish_invalidation
+        self._populate_cache = populate_cache
+
+    def get_department(self, department_id: int) -> Department:
+        key = f"department:{department_id}"
+        cached = self._cache.get(key)
+
+        if cached is None:
+            department = self._repository.get_department(department_id)
+
+            if department is not None and self._populate_cache():
+                self._cache.put(
+                    key,
+                    {
+                        "id": department.id,
+                        "name": department.name,
+                        "company_id": department.company_id,
+                    },
+                )
+
+            return department
+
+        # The owner comes from the company, so ownership changes only need
+        # to invalidate the company.
+        company = self._companies_repository.get_company(cached["company_id"])
+
+        if company is None:
+            return None
+
+        return Department(owner_id=company.owner_id, **cached)
+
+    def get_departments(self, company_id: int) -> list[Department]:
+        return self._repository.get_departments(company_id)
+
+    def get_departments_by_ids(self, department_ids: list[int]) -> list[Department]:
+        return self._repository.get_departments_by_ids(department_ids)
+
+    def invalidate_department(self, department_id: int) -> None:
+        key = f"department:{department_id}"
+        self._cache.delete(key)
+        self._on_transaction_end(lambda: self._cache.delete(key))
+        self._publish_invalidation([key])
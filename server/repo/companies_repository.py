@@ -10,6 +10,9 @@ class CompaniesRepository(Protocol):
     def get_company(self, company_id: int) -> Company:
         pass
 
+    def get_companies_by_ids(self, company_ids: list[int]) -> list[Company]:
+        pass
+
     def create_company(
         self,
         name: str,
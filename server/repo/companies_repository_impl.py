@@ -39,6 +39,22 @@ class CompaniesRepositoryImpl(CompaniesRepository):
             owner_id=db_company.owner_id,
         )
 
+    def get_companies_by_ids(self, company_ids: list[int]) -> list[Company]:
+        db_companies = (
+            self._db.query(DbCompany).filter(DbCompany.id.in_(company_ids)).all()
+        )
+
+        return [
+            Company(
+                id=db_company.id,
+                name=db_company.name,
+                inn=db_company.inn,
+                kpp=db_company.kpp,
+                owner_id=db_company.owner_id,
+            )
+            for db_company in db_companies
+        ]
+
     def create_company(
         self,
         name: str,
@@ -48,7 +64,7 @@ class CompaniesRepositoryImpl(CompaniesRepository):
     ) -> int:
         db_company = DbCompany(name=name, inn=inn, kpp=kpp, owner_id=owner_id)
         self._db.add(db_company)
-        self._db.commit()
+        self._db.flush()
         return db_company.id
 
     def edit_company(
@@ -71,7 +87,7 @@ class CompaniesRepositoryImpl(CompaniesRepository):
         if owner_id:
             db_company.owner_id = owner_id
 
-        self._db.commit()
+        self._db.flush()
 
     def delete_company(self, company_id: int) -> None:
         db_company = self._db.query(DbCompany).filter_by(id=company_id).delete()
@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class DataVersionRepository(Protocol):
+    def get_data_version(self, user_id: int) -> int | None:
+        pass
+
+    def increment_data_version_on_commit(self, user_id: int) -> None:
+        pass
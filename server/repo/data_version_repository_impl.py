@@ -0,0 +1,24 @@
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from server.database.database import before_commit
+from server.database.models import User as DbUser
+from .data_version_repository import DataVersionRepository
+
+
+class DataVersionRepositoryImpl(DataVersionRepository):
+    def __init__(self, db: Session):
+        self._db = db
+
+    def get_data_version(self, user_id: int) -> int | None:
+        return self._db.scalar(select(DbUser.data_version).filter_by(id=user_id))
+
+    def increment_data_version_on_commit(self, user_id: int) -> None:
+        before_commit(self._db, lambda: self._increment_data_version(user_id))
+
+    def _increment_data_version(self, user_id: int) -> None:
+        self._db.execute(
+            update(DbUser)
+            .filter_by(id=user_id)
+            .values(data_version=DbUser.data_version + 1)
+        )
@@ -9,3 +9,9 @@ class DepartmentsRepository(Protocol):
 
     def get_departments(self, company_id: int) -> list[Department]:
         pass
+
+    def get_departments_by_ids(self, department_ids: list[int]) -> list[Department]:
+        pass
+
+    def invalidate_department(self, department_id: int) -> None:
+        pass
@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 
 from server.model.department import Department
-from server.database.models import Department as DbDepartment
+from server.database.models import Company as DbCompany, Department as DbDepartment
 from .departments_repository import DepartmentsRepository
 
 
@@ -10,30 +10,57 @@ class DepartmentsRepositoryImpl(DepartmentsRepository):
         self._db = db
 
     def get_department(self, department_id: int) -> Department:
-        db_department = (
-            self._db.query(DbDepartment).filter_by(id=department_id).one_or_none()
+        row = (
+            self._db.query(DbDepartment, DbCompany.owner_id)
+            .join(DbCompany, DbDepartment.company_id == DbCompany.id)
+            .filter(DbDepartment.id == department_id)
+            .one_or_none()
         )
 
-        if db_department is None:
+        if row is None:
             return None
 
+        db_department, owner_id = row
         return Department(
             id=db_department.id,
-            owner_id=db_department.company.owner_id,
+            owner_id=owner_id,
             name=db_department.name,
             company_id=db_department.company_id,
         )
 
     def get_departments(self, company_id: int) -> list[Department]:
-        db_departments = (
-            self._db.query(DbDepartment).filter_by(company_id=company_id).all()
+        rows = (
+            self._db.query(DbDepartment, DbCompany.owner_id)
+            .join(DbCompany, DbDepartment.company_id == DbCompany.id)
+            .filter(DbDepartment.company_id == company_id)
+            .all()
         )
         return [
             Department(
                 id=db_department.id,
-                owner_id=db_department.company.owner_id,
+                owner_id=owner_id,
                 name=db_department.name,
                 company_id=db_department.company_id,
             )
-            for db_department in db_departments
+            for db_department, owner_id in rows
         ]
+
+    def get_departments_by_ids(self, department_ids: list[int]) -> list[Department]:
+        rows = (
+            self._db.query(DbDepartment, DbCompany.owner_id)
+            .join(DbCompany, DbDepartment.company_id == DbCompany.id)
+            .filter(DbDepartment.id.in_(department_ids))
+            .all()
+        )
+        return [
+            Department(
+                id=db_department.id,
+                owner_id=owner_id,
+                name=db_department.name,
+                company_id=db_department.company_id,
+            )
+            for db_department, owner_id in rows
+        ]
+
+    def invalidate_department(self, department_id: int) -> None:
+        pass
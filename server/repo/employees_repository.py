@@ -7,12 +7,18 @@ class EmployeesRepository(Protocol):
     def get_employee(self, employee_id: int) -> Employee:
         pass
 
+    def get_employees_by_ids(self, employee_ids: list[int]) -> list[Employee]:
+        pass
+
     def get_employees_by_company(self, company_id: int) -> list[Employee]:
         pass
 
     def get_employees_by_department(self, department_id: int) -> list[Employee]:
         pass
 
+    def get_employees_by_departments(self, department_ids: list[int]) -> list[Employee]:
+        pass
+
     def add_employee(self, employee: Employee) -> int:
         pass
 
@@ -1,11 +1,32 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session, joinedload, selectinload, with_polymorphic
 
 from server.model.employee import Employee
 from server.model.department import Department
-from server.database.models import Employee as DbEmployee
+from server.database.models import (
+    Action as DbAction,
+    Department as DbDepartment,
+    DepartmentTransferAction as DbDepartmentTransferAction,
+    Employee as DbEmployee,
+    RecruitmentAction as DbRecruitmentAction,
+)
 from .employees_repository import EmployeesRepository
 
 
+def load_actions():
+    # current_department and last_copmany walk the actions, so bring their
+    # departments and companies along instead of loading them one by one.
+    actions = with_polymorphic(DbAction, "*")
+    return selectinload(DbEmployee.actions.of_type(actions)).options(
+        joinedload(actions.RecruitmentAction.department).joinedload(
+            DbDepartment.company
+        ),
+        joinedload(actions.DepartmentTransferAction.new_department).joinedload(
+            DbDepartment.company
+        ),
+    )
+
+
 def employee_from_db(db_employee: DbEmployee) -> Employee:
     return Employee(
         id=db_employee.id,
@@ -63,6 +84,15 @@ class EmployeesRepositoryImpl(EmployeesRepository):
 
         return employee_from_db(db_employee)
 
+    def get_employees_by_ids(self, employee_ids: list[int]) -> list[Employee]:
+        db_employees = (
+            self._db.query(DbEmployee)
+            .options(load_actions())
+            .filter(DbEmployee.id.in_(employee_ids))
+            .all()
+        )
+        return [employee_from_db(db_employee) for db_employee in db_employees]
+
     def get_employees_by_company(self, company_id: int) -> list[Employee]:
         db_employees = self._db.query(DbEmployee).all()
         return [
@@ -80,10 +110,28 @@ class EmployeesRepositoryImpl(EmployeesRepository):
             and db_employee.current_department.id == department_id
         ]
 
+    def get_employees_by_departments(self, department_ids: list[int]) -> list[Employee]:
+        # Everyone who ever joined one of the departments, the caller keeps
+        # those still working there.
+        employee_ids = select(DbAction.employee_id).where(
+            or_(
+                DbRecruitmentAction.department_id.in_(department_ids),
+                DbDepartmentTransferAction.new_department_id.in_(department_ids),
+            )
+        )
+        db_employees = (
+            self._db.query(DbEmployee)
+            .options(load_actions())
+            .filter(DbEmployee.id.in_(employee_ids))
+            .order_by(DbEmployee.id)
+            .all()
+        )
+        return [employee_from_db(db_employee) for db_employee in db_employees]
+
     def add_employee(self, employee: Employee) -> int:
         db_employee = db_from_employee(employee)
         self._db.add(db_employee)
-        self._db.commit()
+        self._db.flush()
         return db_employee.id
 
     def update_employee(self, employee: Employee) -> None:
@@ -98,7 +146,7 @@ class EmployeesRepositoryImpl(EmployeesRepository):
         db_employee.passport_number = employee.passport_number
         db_employee.passport_date = employee.passport_date
         db_employee.passport_issuer = employee.passport_issuer
-        self._db.commit()
+        self._db.flush()
 
     def delete_employee(self, employee_id: int) -> None:
         employee = self._db.query(DbEmployee).filter_by(id=employee_id).one_or_none()
@@ -107,7 +155,7 @@ class EmployeesRepositoryImpl(EmployeesRepository):
             return
 
         self._db.delete(employee)
-        self._db.commit()
+        self._db.flush()
 
     def delete_employees(self, company_id: int) -> None:
         employees = [
@@ -119,4 +167,4 @@ class EmployeesRepositoryImpl(EmployeesRepository):
         for employee in employees:
             self._db.delete(employee)
 
-        self._db.commit()
+        self._db.flush()
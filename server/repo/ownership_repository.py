@@ -0,0 +1,23 @@
+from typing import Callable, Protocol
+
+from server.model.ownership import Ownership
+
+
+class OwnershipRepository(Protocol):
+    def get_ownership(self, user_id: int) -> Ownership:
+        pass
+
+    def get_company_owner(self, company_id: int) -> int | None:
+        pass
+
+    def get_department_owner(self, department_id: int) -> int | None:
+        pass
+
+    def get_employee_owner(self, employee_id: int) -> int | None:
+        pass
+
+    def on_transaction_end(self, callback: Callable[[], None]) -> None:
+        pass
+
+    def publish_invalidation(self, user_ids: list[int]) -> None:
+        pass
@@ -0,0 +1,58 @@
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from server.cache.invalidation_bus import InvalidationBus
+from server.database.database import on_transaction_end
+from server.model.ownership import Ownership
+from server.database.models import (
+    Company as DbCompany,
+    Department as DbDepartment,
+    Employee as DbEmployee,
+)
+from .ownership_repository import OwnershipRepository
+
+
+class OwnershipRepositoryImpl(OwnershipRepository):
+    def __init__(self, db: Session, invalidation_bus: InvalidationBus | None = None):
+        self._db = db
+        self._invalidation_bus = invalidation_bus
+
+    def get_ownership(self, user_id: int) -> Ownership:
+        company_ids = self._db.scalars(
+            select(DbCompany.id).filter_by(owner_id=user_id)
+        )
+        department_ids = self._db.scalars(
+            select(DbDepartment.id)
+            .join(DbCompany, DbDepartment.company_id == DbCompany.id)
+            .filter(DbCompany.owner_id == user_id)
+        )
+        employee_ids = self._db.scalars(
+            select(DbEmployee.id).filter_by(owner_id=user_id)
+        )
+        return Ownership(
+            company_ids=frozenset(company_ids),
+            department_ids=frozenset(department_ids),
+            employee_ids=frozenset(employee_ids),
+        )
+
+    def get_company_owner(self, company_id: int) -> int | None:
+        return self._db.scalar(select(DbCompany.owner_id).filter_by(id=company_id))
+
+    def get_department_owner(self, department_id: int) -> int | None:
+        return self._db.scalar(
+            select(DbCompany.owner_id)
+            .join(DbDepartment, DbDepartment.company_id == DbCompany.id)
+            .filter(DbDepartment.id == department_id)
+        )
+
+    def get_employee_owner(self, employee_id: int) -> int | None:
+        return self._db.scalar(select(DbEmployee.owner_id).filter_by(id=employee_id))
+
+    def on_transaction_end(self, callback: Callable[[], None]) -> None:
+        on_transaction_end(self._db, callback)
+
+    def publish_invalidation(self, user_ids: list[int]) -> None:
+        if self._invalidation_bus is not None:
+            self._invalidation_bus.publish(self._db, "ownership", user_ids)
@@ -0,0 +1,16 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class BatchError(BaseModel):
+    id: int
+    status: int
+    detail: str
+
+
+class Batch(BaseModel, Generic[T]):
+    items: list[T]
+    errors: list[BatchError]
@@ -1,6 +1,9 @@
 from typing import Annotated
 from pydantic import BaseModel, StringConstraints
 
+from server.schemas.departments import Department
+from server.schemas.employees import Employee
+
 
 class Company(BaseModel):
     id: int
@@ -27,3 +30,11 @@ class EditCompanyRequest(BaseModel):
 
 class CreatedCompanyId(BaseModel):
     id: int
+
+
+class DepartmentSnapshot(Department):
+    employees: list[Employee]
+
+
+class CompanySnapshot(Company):
+    departments: list[DepartmentSnapshot]
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class DatabasePoolStatus(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    checkout_time: float
+    max_checkout_time: float
+
+
+class StartupStatus(BaseModel):
+    startup_time: float
@@ -2,6 +2,7 @@ from server.repo.actions_repository import ActionsRepository
 from server.repo.departments_repository import DepartmentsRepository
 from server.repo.employees_repository import EmployeesRepository
 from server.services.convert_actions_to_schemas import convert_actions_to_schemas
+from server.services.ownership_service import OwnershipService
 from .actions_service import (
     ActionNotExistsError,
     ActionsService,
@@ -20,19 +21,17 @@ class ActionsServiceImpl(ActionsService):
         actions_repository: ActionsRepository,
         employees_repository: EmployeesRepository,
         departments_repository: DepartmentsRepository,
+        ownership_service: OwnershipService,
     ):
         self._actions_repository = actions_repository
         self._employees_repository = employees_repository
         self._departments_repository = departments_repository
+        self._ownership_service = ownership_service
 
     def get_actions(self, user_id: int, employee_id: int):
-        employee = self._employees_repository.get_employee(employee_id)
-
-        if employee is None:
-            raise EmployeNotExistsError()
-
-        if employee.owner_id != user_id:
-            raise ForbiddenError()
+        self._ownership_service.require_employee(
+            user_id, employee_id, EmployeNotExistsError, ForbiddenError
+        )
 
         actions = self._actions_repository.get_actions(employee_id)
 
@@ -44,10 +43,9 @@ class ActionsServiceImpl(ActionsService):
     def create_action(
         self, user_id: int, employee_id: int, create_action_request: CreateActionRequest
     ):
-        employee = self._employees_repository.get_employee(employee_id)
-
-        if employee.owner_id != user_id:
-            raise ForbiddenError()
+        self._ownership_service.require_employee(
+            user_id, employee_id, EmployeNotExistsError, ForbiddenError
+        )
 
         action = self._create_action_from_request(
             user_id, employee_id, create_action_request
@@ -62,10 +60,9 @@ class ActionsServiceImpl(ActionsService):
         if not action:
             raise ActionNotExistsError()
 
-        employee = self._employees_repository.get_employee(action.employee_id)
-
-        if employee.owner_id != user_id:
-            raise ForbiddenError()
+        self._ownership_service.require_employee(
+            user_id, action.employee_id, EmployeNotExistsError, ForbiddenError
+        )
 
         new_action = self._create_action_from_request(
             user_id, action.employee_id, create_action_request
@@ -80,10 +77,9 @@ class ActionsServiceImpl(ActionsService):
         if not action:
             raise ActionNotExistsError()
 
-        employee = self._employees_repository.get_employee(action.employee_id)
-
-        if employee.owner_id != user_id:
-            raise ForbiddenError()
+        self._ownership_service.require_employee(
+            user_id, action.employee_id, EmployeNotExistsError, ForbiddenError
+        )
 
         self._actions_repository.delete_action(action_id=action_id)
 
@@ -92,16 +88,13 @@ class ActionsServiceImpl(ActionsService):
     ) -> Action:
         match create_action_request.action_type:
             case "recruitment":
-                department = self._departments_repository.get_department(
-                    create_action_request.department_id
+                self._ownership_service.require_department(
+                    user_id,
+                    create_action_request.department_id,
+                    DepartmentNotExistsError,
+                    NoAccessToDepartmentError,
                 )
 
-                if department is None:
-                    raise DepartmentNotExistsError()
-
-                if department.owner_id != user_id:
-                    raise NoAccessToDepartmentError()
-
                 return RecruitmentAction(
                     employee_id=employee_id,
                     date=create_action_request.date,
@@ -116,16 +109,13 @@ class ActionsServiceImpl(ActionsService):
                     new_position=create_action_request.new_position,
                 )
             case "department_transfer":
-                department = self._departments_repository.get_department(
-                    create_action_request.new_department_id
+                self._ownership_service.require_department(
+                    user_id,
+                    create_action_request.new_department_id,
+                    DepartmentNotExistsError,
+                    NoAccessToDepartmentError,
                 )
 
-                if department is None:
-                    raise DepartmentNotExistsError()
-
-                if department.owner_id != user_id:
-                    raise NoAccessToDepartmentError()
-
                 return DepartmentTransferAction(
                     employee_id=employee_id,
                     date=create_action_request.date,
@@ -0,0 +1,62 @@
+import logging
+from threading import Event, Thread
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from server.repo.auth.refresh_token_repository_impl import RefreshTokenRepositoryImpl
+
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenSweeper:
+    def __init__(
+        self, session_factory: Callable[[], Session], interval: float, batch_size: int
+    ):
+        self._session_factory = session_factory
+        self._interval = interval
+        self._batch_size = batch_size
+        self._stopped = Event()
+        self._thread = None
+
+    def start(self) -> None:
+        self._stopped.clear()
+        self._thread = Thread(
+            target=self._run, name="refresh-token-sweeper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sweep(self) -> int:
+        deleted = 0
+
+        while not self._stopped.is_set():
+            with self._session_factory() as db, db.begin():
+                count = RefreshTokenRepositoryImpl(db).delete_expired_refresh_tokens(
+                    self._batch_size
+                )
+            deleted += count
+
+            if count < self._batch_size:
+                break
+
+        return deleted
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                deleted = self.sweep()
+            except Exception:
+                logger.exception("Failed to delete expired refresh tokens")
+            else:
+                if deleted:
+                    logger.info("Deleted %d expired refresh tokens", deleted)
+
+            self._stopped.wait(self._interval)
@@ -1,3 +1,5 @@
+from server.database.database import run_db
+from server.model.auth.user import User
 from server.repo.auth.user_repository import UserRepository
 from server.repo.auth.access_token_repository import AccessTokenRepository
 from server.repo.auth.refresh_token_repository import RefreshTokenRepository
@@ -30,15 +32,23 @@ class TokenService:
         self._refresh_token_repository = refresh_token_repository
         self._user_repository = user_repository
 
-    def create_token(self, email: str, password: str):
-        user = self._user_repository.find_user_by_email(email)
+    async def create_token(self, email: str, password: str):
+        user = await run_db(self._user_repository.find_user_by_email, email)
 
         if not user:
             raise UserDoesNotExistError()
 
-        if not user.validate_password(password):
+        password_hash = user.password_hash
+
+        if not await user.validate_password(password):
             raise InvalidPasswordError()
 
+        return await run_db(self._create_tokens, user, password_hash)
+
+    def _create_tokens(self, user: User, password_hash: str):
+        if user.password_hash != password_hash:
+            self._user_repository.update_password_hash(user.id, user.password_hash)
+
         access_token = self._access_token_repository.create_access_token(user.id).token
         refresh_token = self._refresh_token_repository.create_refresh_token(user.id)
 
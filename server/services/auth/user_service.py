@@ -1,6 +1,8 @@
 import re
+from server.database.database import run_db
 from server.model.auth.user import User
 from server.repo.auth.user_repository import UserRepository
+from server.services.ownership_service import OwnershipService
 
 
 class UserAlreadyExistsError(Exception):
@@ -12,23 +14,30 @@ class InvalidEmail(Exception):
 
 
 class UserService:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self, user_repository: UserRepository, ownership_service: OwnershipService
+    ):
         self._repository = user_repository
+        self._ownership_service = ownership_service
 
-    def create_user(self, email: str, password: str) -> User:
-        if self._repository.find_user_by_email(email=email) is not None:
+    async def create_user(self, email: str, password: str) -> User:
+        if await run_db(self._repository.find_user_by_email, email=email) is not None:
             raise UserAlreadyExistsError()
 
         if not self._validate_email(email):
             raise InvalidEmail()
 
-        user = User.new(email, password)
-        db_user = self._repository.create_user(user.email, user.password_hash)
+        # Hashing runs on the password hasher's pool, not a database thread.
+        user = await User.new(email, password)
+        db_user = await run_db(
+            self._repository.create_user, user.email, user.password_hash
+        )
         user.id = db_user.id
         return user
 
     def delete_user(self, user_id) -> None:
         self._repository.delete_user(user_id)
+        self._ownership_service.invalidate(user_id)
 
     @staticmethod
     def _validate_email(email: str):
@@ -0,0 +1,27 @@
+from typing import Any, Callable, TypeVar
+
+from server.schemas.batch import Batch, BatchError
+
+T = TypeVar("T")
+
+
+def collect_batch(
+    ids: list[int],
+    found: dict[int, Any],
+    user_id: int,
+    convert: Callable[[Any], T],
+) -> Batch[T]:
+    items = []
+    errors = []
+
+    for id in ids:
+        model = found.get(id)
+
+        if model is None:
+            errors.append(BatchError(id=id, status=404, detail="Not found"))
+        elif model.owner_id != user_id:
+            errors.append(BatchError(id=id, status=403, detail="Forbidden"))
+        else:
+            items.append(convert(model))
+
+    return Batch(items=items, errors=errors)
@@ -1,5 +1,6 @@
 from typing import Iterable, Protocol
 
+from server.schemas.batch import Batch
 from server.schemas.companies import Company
 
 
@@ -18,6 +19,11 @@ class CompaniesService(Protocol):
     def get_company(self, user_id: int, company_id: int) -> Company:
         pass
 
+    def get_companies_by_ids(
+        self, user_id: int, company_ids: list[int]
+    ) -> Batch[Company]:
+        pass
+
     def create_company(
         self,
         name: str,
@@ -1,14 +1,22 @@
 from typing import Iterable
 
 from server.model.company import Company
+from server.schemas.batch import Batch
 from server.schemas.companies import Company as CompanySchema
 from server.repo.companies_repository import CompaniesRepository
+from server.services.batch import collect_batch
+from server.services.ownership_service import OwnershipService
 from .companies_service import CompaniesService, CompanyNotExistError, ForbiddenError
 
 
 class CompaniesServiceImpl(CompaniesService):
-    def __init__(self, companies_repository: CompaniesRepository):
+    def __init__(
+        self,
+        companies_repository: CompaniesRepository,
+        ownership_service: OwnershipService,
+    ):
         self._repository = companies_repository
+        self._ownership_service = ownership_service
 
     def get_companies(self, user_id: int) -> Iterable[CompanySchema]:
         companies = self._repository.get_companies(user_id)
@@ -33,6 +41,19 @@ class CompaniesServiceImpl(CompaniesService):
             id=company.id, name=company.name, inn=company.inn, kpp=company.kpp
         )
 
+    def get_companies_by_ids(
+        self, user_id: int, company_ids: list[int]
+    ) -> Batch[CompanySchema]:
+        companies = self._repository.get_companies_by_ids(company_ids)
+        return collect_batch(
+            company_ids,
+            {company.id: company for company in companies},
+            user_id,
+            lambda company: CompanySchema(
+                id=company.id, name=company.name, inn=company.inn, kpp=company.kpp
+            ),
+        )
+
     def create_company(
         self,
         name: str,
@@ -41,6 +62,7 @@ class CompaniesServiceImpl(CompaniesService):
         owner_id: int,
     ) -> int:
         company_id = self._repository.create_company(name, inn, kpp, owner_id)
+        self._ownership_service.invalidate(owner_id)
         return company_id
 
     def edit_company(
@@ -53,25 +75,21 @@ class CompaniesServiceImpl(CompaniesService):
         kpp: str = None,
         owner_id: int = None,
     ) -> None:
-        company = self._repository.get_company(company_id)
-
-        if company is None:
-            raise CompanyNotExistError()
-
-        if company.owner_id != user_id:
-            raise ForbiddenError()
+        self._ownership_service.require_company(
+            user_id, company_id, CompanyNotExistError, ForbiddenError
+        )
 
         self._repository.edit_company(
             company_id, name=name, inn=inn, kpp=kpp, owner_id=owner_id
         )
 
-    def delete_company(self, user_id: int, company_id: int) -> None:
-        company = self._repository.get_company(company_id)
-
-        if company is None:
-            raise CompanyNotExistError()
+        if owner_id:
+            self._ownership_service.invalidate(user_id, owner_id)
 
-        if company.owner_id != user_id:
-            raise ForbiddenError()
+    def delete_company(self, user_id: int, company_id: int) -> None:
+        self._ownership_service.require_company(
+            user_id, company_id, CompanyNotExistError, ForbiddenError
+        )
 
         self._repository.delete_company(company_id)
+        self._ownership_service.invalidate(user_id)
@@ -1,5 +1,6 @@
 from typing import Literal, Protocol
 
+from server.schemas.batch import Batch
 from server.schemas.employees import CreatedEmployeeId, Employee, CreateEmployeeRequest
 
 
@@ -33,6 +34,11 @@ class EmployeesService(Protocol):
     ) -> Employee:
         pass
 
+    def get_employees_by_ids(
+        self, user_id: int, employee_ids: list[int]
+    ) -> Batch[Employee]:
+        pass
+
     def create_employee(
         self, user_id: int, create_employee_request: CreateEmployeeRequest
     ) -> CreatedEmployeeId:
@@ -4,6 +4,7 @@ from server.repo.actions_repository import ActionsRepository
 from server.repo.companies_repository import CompaniesRepository
 from server.repo.departments_repository import DepartmentsRepository
 from server.repo.employees_repository import EmployeesRepository
+from server.schemas.batch import Batch
 from server.schemas.departments import Department
 from server.schemas.actions import ActionWrapper
 from server.schemas.employees import (
@@ -12,7 +13,9 @@ from server.schemas.employees import (
     CreateEmployeeRequest,
     CreatedEmployeeId,
 )
+from server.services.batch import collect_batch
 from server.services.convert_actions_to_schemas import convert_actions_to_schemas
+from server.services.ownership_service import OwnershipService
 from .employees_service import (
     EmployeesService,
     EmployeeNotExistsError,
@@ -82,20 +85,18 @@ class EmployeesServiceImpl(EmployeesService):
         companies_repository: CompaniesRepository,
         departments_repository: DepartmentsRepository,
         actions_repository: ActionsRepository,
+        ownership_service: OwnershipService,
     ):
         self._employees_repository = employees_repository
         self._companies_repository = companies_repository
         self._departments_repository = departments_repository
         self._actions_repository = actions_repository
+        self._ownership_service = ownership_service
 
     def get_employees_by_company(self, user_id: int, company_id: int) -> list[Employee]:
-        company = self._companies_repository.get_company(company_id)
-
-        if company is None:
-            raise CompanyNotExistsError()
-
-        if company.owner_id != user_id:
-            raise ForbiddenError()
+        self._ownership_service.require_company(
+            user_id, company_id, CompanyNotExistsError, ForbiddenError
+        )
 
         employees = self._employees_repository.get_employees_by_company(company_id)
         return [employee_from_model(employee) for employee in employees]
@@ -103,13 +104,9 @@ class EmployeesServiceImpl(EmployeesService):
     def get_employees_by_department(
         self, user_id: int, department_id: int
     ) -> list[Employee]:
-        department = self._departments_repository.get_department(department_id)
-
-        if department is None:
-            raise DepartmentNotExistsError()
-
-        if department.owner_id != user_id:
-            raise ForbiddenError()
+        self._ownership_service.require_department(
+            user_id, department_id, DepartmentNotExistsError, ForbiddenError
+        )
 
         employees = self._employees_repository.get_employees_by_department(
             department_id
@@ -141,11 +138,23 @@ class EmployeesServiceImpl(EmployeesService):
             ),
         )
 
+    def get_employees_by_ids(
+        self, user_id: int, employee_ids: list[int]
+    ) -> Batch[Employee]:
+        employees = self._employees_repository.get_employees_by_ids(employee_ids)
+        return collect_batch(
+            employee_ids,
+            {employee.id: employee for employee in employees},
+            user_id,
+            employee_from_model,
+        )
+
     def create_employee(
         self, user_id: int, create_employee_request: CreateEmployeeRequest
     ) -> CreatedEmployeeId:
         employee = model_from_request(create_employee_request, user_id)
         employee_id = self._employees_repository.add_employee(employee)
+        self._ownership_service.invalidate(user_id)
         return CreatedEmployeeId(id=employee_id)
 
     def update_employee(
@@ -154,25 +163,18 @@ class EmployeesServiceImpl(EmployeesService):
         employee_id: int,
         create_employee_request: CreateEmployeeRequest,
     ) -> None:
-        employee = self._employees_repository.get_employee(employee_id)
-
-        if employee is None:
-            raise EmployeeNotExistsError()
-
-        if employee.owner_id != user_id:
-            raise ForbiddenError()
+        self._ownership_service.require_employee(
+            user_id, employee_id, EmployeeNotExistsError, ForbiddenError
+        )
 
         employee = model_from_request(create_employee_request, user_id)
         employee.id = employee_id
         self._employees_repository.update_employee(employee)
 
     def delete_employee(self, user_id: int, employee_id: int):
-        employee = self._employees_repository.get_employee(employee_id)
-
-        if employee is None:
-            raise EmployeeNotExistsError()
-
-        if employee.owner_id != user_id:
-            raise ForbiddenError()
+        self._ownership_service.require_employee(
+            user_id, employee_id, EmployeeNotExistsError, ForbiddenError
+        )
 
         self._employees_repository.delete_employee(employee_id)
+        self._ownership_service.invalidate(user_id)
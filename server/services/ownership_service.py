@@ -0,0 +1,94 @@
+from server.cache.lru_cache import LRUCache
+from server.model.ownership import Ownership
+from server.repo.ownership_repository import OwnershipRepository
+
+
+class OwnershipService:
+    def __init__(self, ownership_repository: OwnershipRepository, cache: LRUCache):
+        self._repository = ownership_repository
+        self._cache = cache
+
+    def owns_company(self, user_id: int, company_id: int) -> bool:
+        return company_id in self._get_ownership(user_id).company_ids
+
+    def owns_department(self, user_id: int, department_id: int) -> bool:
+        return department_id in self._get_ownership(user_id).department_ids
+
+    def owns_employee(self, user_id: int, employee_id: int) -> bool:
+        return employee_id in self._get_ownership(user_id).employee_ids
+
+    def require_company(
+        self,
+        user_id: int,
+        company_id: int,
+        not_found: type[Exception],
+        forbidden: type[Exception],
+    ) -> None:
+        if not self.owns_company(user_id, company_id):
+            self._require_owner(
+                user_id,
+                self._repository.get_company_owner(company_id),
+                not_found,
+                forbidden,
+            )
+
+    def require_department(
+        self,
+        user_id: int,
+        department_id: int,
+        not_found: type[Exception],
+        forbidden: type[Exception],
+    ) -> None:
+        if not self.owns_department(user_id, department_id):
+            self._require_owner(
+                user_id,
+                self._repository.get_department_owner(department_id),
+                not_found,
+                forbidden,
+            )
+
+    def require_employee(
+        self,
+        user_id: int,
+        employee_id: int,
+        not_found: type[Exception],
+        forbidden: type[Exception],
+    ) -> None:
+        if not self.owns_employee(user_id, employee_id):
+            self._require_owner(
+                user_id,
+                self._repository.get_employee_owner(employee_id),
+                not_found,
+                forbidden,
+            )
+
+    def invalidate(self, *user_ids: int) -> None:
+        self._evict(user_ids)
+        self._repository.on_transaction_end(lambda: self._evict(user_ids))
+        self._repository.publish_invalidation(list(user_ids))
+
+    def _evict(self, user_ids: tuple[int, ...]) -> None:
+        for user_id in user_ids:
+            self._cache.pop(user_id)
+
+    @staticmethod
+    def _require_owner(
+        user_id: int,
+        owner_id: int | None,
+        not_found: type[Exception],
+        forbidden: type[Exception],
+    ) -> None:
+        if owner_id is None:
+            raise not_found()
+
+        if owner_id != user_id:
+            raise forbidden()
+
+    def _get_ownership(self, user_id: int) -> Ownership:
+        ownership = self._cache.get(user_id)
+
+        if ownership is None:
+            ownership = self._repository.get_ownership(user_id)
+            self._cache.put(user_id, ownership)
+
+        return ownership
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Protocol
 
 
@@ -9,6 +10,31 @@ class CompanyNotExistsError(Exception):
     pass
 
 
+@dataclass
+class Employee:
+    name: str
+    position: str
+    salary: str
+
+
+@dataclass
+class Department:
+    name: str
+    employees: list[Employee]
+
+
+@dataclass
+class CompanyReport:
+    company_name: str
+    departments: list[Department]
+
+
 class ReportsService(Protocol):
     def generate_report(self, user_id: int, company_id: int) -> bytes:
         pass
+
+    def get_report_data(self, user_id: int, company_id: int) -> CompanyReport:
+        pass
+
+    def render_report(self, report_data: CompanyReport) -> bytes:
+        pass
@@ -2,18 +2,20 @@ from dataclasses import dataclass
 from functools import cache
 from io import BytesIO
 import os
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfbase import pdfmetrics
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 
 from server.repo.companies_repository import CompaniesRepository
 from server.repo.departments_repository import DepartmentsRepository
 from server.repo.employees_repository import EmployeesRepository
+from server.services.ownership_service import OwnershipService
 
-from .reports_service import ReportsService, CompanyNotExistsError, ForbiddenError
+from .reports_service import (
+    ReportsService,
+    CompanyNotExistsError,
+    ForbiddenError,
+    CompanyReport,
+    Department,
+    Employee,
+)
 
 
 TABLE_HEADER = ["ФИО", "Должность", "Зарплата"]
@@ -49,23 +51,39 @@ def find_font(font_name: str) -> str:
     return None
 
 
-@dataclass
-class Employee:
-    name: str
-    position: str
-    salary: str
-
-
-@dataclass
-class Department:
-    name: str
-    employees: list[Employee]
-
-
-@dataclass
-class CompanyReport:
-    company_name: str
-    departments: list[Department]
+@cache
+def report_styles():
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    pdfmetrics.registerFont(TTFont("DejaVuSans", find_font("DejaVuSans.ttf")))
+
+    styles = getSampleStyleSheet()
+    h1_style = ParagraphStyle(
+        "H1",
+        parent=styles["Normal"],
+        fontName="DejaVuSans",
+        fontSize=18,
+        leading=18 * 1.4,
+    )
+    h2_style = ParagraphStyle(
+        "H2",
+        parent=styles["Normal"],
+        fontName="DejaVuSans",
+        fontSize=15,
+        leading=15 * 1.4,
+    )
+    table_style = TableStyle(
+        [
+            ("FONTNAME", (0, 0), (-1, 0), "DejaVuSans"),  # Header font
+            ("FONTNAME", (0, 0), (-1, -1), "DejaVuSans"),  # Header font
+            ("GRID", (0, 0), (-1, -1), 1, colors.black),  # Grid lines
+        ]
+    )
+    return h1_style, h2_style, table_style
 
 
 @dataclass
@@ -118,52 +136,32 @@ class ReportsServiceImpl(ReportsService):
         companies_repository: CompaniesRepository,
         departments_repository: DepartmentsRepository,
         employees_repository: EmployeesRepository,
+        ownership_service: OwnershipService,
     ):
         self._companies_repository = companies_repository
         self._departments_repository = departments_repository
         self._employees_repository = employees_repository
+        self._ownership_service = ownership_service
 
     def generate_report(self, user_id: int, company_id: int) -> bytes:
-        company = self._companies_repository.get_company(company_id)
-
-        if company is None:
-            raise CompanyNotExistsError()
+        return self.render_report(self.get_report_data(user_id, company_id))
 
-        if company.owner_id != user_id:
-            raise ForbiddenError()
+    def get_report_data(self, user_id: int, company_id: int) -> CompanyReport:
+        self._ownership_service.require_company(
+            user_id, company_id, CompanyNotExistsError, ForbiddenError
+        )
 
-        report_data = CompanyReportGenerator(
+        return CompanyReportGenerator(
             self._companies_repository,
             self._departments_repository,
             self._employees_repository,
         ).generate_report_data(company_id)
-        return self._generate_report_pdf(report_data)
-
-    def _generate_report_pdf(self, report_data: CompanyReport) -> bytes:
-        pdfmetrics.registerFont(TTFont("DejaVuSans", find_font("DejaVuSans.ttf")))
-
-        styles = getSampleStyleSheet()
-        h1_style = ParagraphStyle(
-            "H1",
-            parent=styles["Normal"],
-            fontName="DejaVuSans",
-            fontSize=18,
-            leading=18 * 1.4,
-        )
-        h2_style = ParagraphStyle(
-            "H2",
-            parent=styles["Normal"],
-            fontName="DejaVuSans",
-            fontSize=15,
-            leading=15 * 1.4,
-        )
-        table_style = TableStyle(
-            [
-                ("FONTNAME", (0, 0), (-1, 0), "DejaVuSans"),  # Header font
-                ("FONTNAME", (0, 0), (-1, -1), "DejaVuSans"),  # Header font
-                ("GRID", (0, 0), (-1, -1), 1, colors.black),  # Grid lines
-            ]
-        )
+
+    def render_report(self, report_data: CompanyReport) -> bytes:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Table
+
+        h1_style, h2_style, table_style = report_styles()
 
         buffer = BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
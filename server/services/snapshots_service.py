@@ -0,0 +1,10 @@
+from typing import Protocol
+
+from server.schemas.companies import CompanySnapshot
+
+
+class SnapshotsService(Protocol):
+    def get_company_snapshot(
+        self, user_id: int, company_id: int, include_actions: bool = False
+    ) -> CompanySnapshot:
+        pass
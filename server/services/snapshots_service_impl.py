@@ -0,0 +1,132 @@
+from server.model.department import Department
+from server.model.employee import Employee
+from server.repo.actions_repository import ActionsRepository
+from server.repo.companies_repository import CompaniesRepository
+from server.repo.departments_repository import DepartmentsRepository
+from server.repo.employees_repository import EmployeesRepository
+from server.schemas.actions import ActionWrapper
+from server.schemas.companies import CompanySnapshot, DepartmentSnapshot
+from server.services.companies_service import CompanyNotExistError, ForbiddenError
+from server.services.convert_actions_to_schemas import convert_actions_to_schemas
+from server.services.employees_service_impl import employee_from_model
+from server.services.ownership_service import OwnershipService
+from .snapshots_service import SnapshotsService
+
+
+class LoadedDepartmentsRepository:
+    def __init__(
+        self,
+        departments: list[Department],
+        departments_repository: DepartmentsRepository,
+    ):
+        self._departments = {department.id: department for department in departments}
+        self._repository = departments_repository
+
+    def get_department(self, department_id: int) -> Department:
+        department = self._departments.get(department_id)
+
+        if department is None:
+            return self._repository.get_department(department_id)
+
+        return department
+
+    def get_departments(self, company_id: int) -> list[Department]:
+        return self._repository.get_departments(company_id)
+
+    def get_departments_by_ids(self, department_ids: list[int]) -> list[Department]:
+        return self._repository.get_departments_by_ids(department_ids)
+
+    def invalidate_department(self, department_id: int) -> None:
+        self._repository.invalidate_department(department_id)
+
+
+class SnapshotsServiceImpl(SnapshotsService):
+    def __init__(
+        self,
+        companies_repository: CompaniesRepository,
+        departments_repository: DepartmentsRepository,
+        employees_repository: EmployeesRepository,
+        actions_repository: ActionsRepository,
+        ownership_service: OwnershipService,
+    ):
+        self._companies_repository = companies_repository
+        self._departments_repository = departments_repository
+        self._employees_repository = employees_repository
+        self._actions_repository = actions_repository
+        self._ownership_service = ownership_service
+
+    def get_company_snapshot(
+        self, user_id: int, company_id: int, include_actions: bool = False
+    ) -> CompanySnapshot:
+        self._ownership_service.require_company(
+            user_id, company_id, CompanyNotExistError, ForbiddenError
+        )
+        company = self._companies_repository.get_company(company_id)
+
+        if company is None:
+            raise CompanyNotExistError()
+
+        departments = self._departments_repository.get_departments(company_id)
+        employees = self._get_current_employees(departments)
+        timelines = (
+            self._get_timelines(departments, employees) if include_actions else {}
+        )
+
+        return CompanySnapshot(
+            id=company.id,
+            name=company.name,
+            inn=company.inn,
+            kpp=company.kpp,
+            departments=[
+                DepartmentSnapshot(
+                    id=department.id,
+                    name=department.name,
+                    company_id=department.company_id,
+                    employees=[
+                        employee_from_model(employee, timelines.get(employee.id))
+                        for employee in employees[department.id]
+                    ],
+                )
+                for department in departments
+            ],
+        )
+
+    def _get_current_employees(
+        self, departments: list[Department]
+    ) -> dict[int, list[Employee]]:
+        employees = {department.id: [] for department in departments}
+
+        if not employees:
+            return employees
+
+        for employee in self._employees_repository.get_employees_by_departments(
+            list(employees)
+        ):
+            if (
+                employee.current_department is not None
+                and employee.current_department.id in employees
+            ):
+                employees[employee.current_department.id].append(employee)
+
+        return employees
+
+    def _get_timelines(
+        self, departments: list[Department], employees: dict[int, list[Employee]]
+    ) -> dict[int, list[ActionWrapper]]:
+        actions = self._actions_repository.get_actions_by_employee_ids(
+            [
+                employee.id
+                for department_employees in employees.values()
+                for employee in department_employees
+            ]
+        )
+        departments_repository = LoadedDepartmentsRepository(
+            departments, self._departments_repository
+        )
+        return {
+            employee_id: list(
+                convert_actions_to_schemas(departments_repository, employee_actions)
+            )
+            for employee_id, employee_actions in actions.items()
+            if employee_actions
+        }
@@ -8,13 +8,52 @@ class Settings(BaseSettings):
     postgres_host: str
     postgres_port: str
     secret_key: str
+    database_url: str | None = None
+    database_read_url: str | None = None
+    read_after_write_window: float = 5
+    recent_writers_cache_size: int = 10000
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
+    db_echo: bool = False
+    db_async: bool = False
+    db_create_schema: bool = False
+    fast_json_responses: bool = True
+    batch_get_max_ids: int = 100
+    compression_minimum_size: int = 1024
+    compression_encodings: list[str] = ["zstd", "br", "gzip"]
+    detect_n_plus_one: bool = False
+    n_plus_one_threshold: int = 5
+    tracing_sample_rate: float = 0.01
+    tracing_file: str | None = None
+    tracing_otlp_endpoint: str | None = None
+    tracing_service_name: str = "server"
+    bcrypt_rounds: int = 12
+    password_hashing_workers: int = 2
+    password_hashing_queue_size: int = 16
+    access_token_cache_size: int = 10000
+    auth_ip_rate: float = 1
+    auth_ip_burst: int = 20
+    auth_email_rate: float = 0.1
+    auth_email_burst: int = 5
+    rate_limiter_size: int = 100000
+    ownership_cache_size: int = 1024
+    ownership_cache_ttl: float = 60
+    entity_cache_backend: str = "lru"
+    entity_cache_size: int = 10000
+    entity_cache_ttl: float = 300
+    entity_cache_redis_url: str = "redis://localhost:6379/0"
+    entity_cache_redis_timeout: float = 0.1
+    cache_invalidation_listen: bool = True
+    cache_invalidation_reconnect_interval: float = 5
+    refresh_token_sweep_interval: float = 3600
+    refresh_token_sweep_batch_size: int = 1000
 
     model_config = SettingsConfigDict(env_file=".env")
 
 
-settings = Settings()
-
-
 @cache
 def get_settings():
     return Settings()
@@ -0,0 +1,136 @@
+import json
+import logging
+import urllib.request
+from collections import deque
+from threading import Event, Lock, Thread
+from typing import Protocol
+
+from .tracer import Span
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: list[Span]) -> None:
+        pass
+
+
+def _attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(span: Span) -> dict:
+    otlp_span = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": int(span.kind),
+        "startTimeUnixNano": str(span.start_time),
+        "endTimeUnixNano": str(span.end_time),
+        "attributes": [_attribute(k, v) for k, v in span.attributes.items()],
+        "status": ({"code": 2, "message": span.error} if span.error else {"code": 1}),
+    }
+
+    if span.parent_span_id:
+        otlp_span["parentSpanId"] = span.parent_span_id
+
+    return otlp_span
+
+
+def to_otlp(spans: list[Span], service_name: str) -> dict:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_attribute("service.name", service_name)]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "server.tracing"},
+                        "spans": [_otlp_span(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class FileSpanExporter:
+    def __init__(self, path: str, service_name: str):
+        self._path = path
+        self._service_name = service_name
+
+    def export(self, spans: list[Span]) -> None:
+        with open(self._path, "a") as file:
+            file.write(json.dumps(to_otlp(spans, self._service_name)) + "\n")
+
+
+class OtlpHttpSpanExporter:
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 10):
+        self._endpoint = endpoint
+        self._service_name = service_name
+        self._timeout = timeout
+
+    def export(self, spans: list[Span]) -> None:
+        request = urllib.request.Request(
+            self._endpoint,
+            data=json.dumps(to_otlp(spans, self._service_name)).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+
+        with urllib.request.urlopen(request, timeout=self._timeout):
+            pass
+
+
+class BatchSpanProcessor:
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_queue_size: int = 2048,
+        batch_size: int = 512,
+        interval: float = 5,
+    ):
+        self._exporter = exporter
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._interval = interval
+        self._queue: deque[Span] = deque()
+        self._export_lock = Lock()
+        self._stopped = Event()
+        self._thread = Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+        self.dropped = 0
+
+    def on_end(self, span: Span) -> None:
+        if len(self._queue) >= self._max_queue_size:
+            self.dropped += 1
+            return
+
+        self._queue.append(span)
+
+    def flush(self) -> None:
+        with self._export_lock:
+            while self._queue:
+                batch = []
+
+                while self._queue and len(batch) < self._batch_size:
+                    batch.append(self._queue.popleft())
+
+                try:
+                    self._exporter.export(batch)
+                except Exception:
+                    logger.exception("Failed to export %d spans", len(batch))
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.flush()
@@ -0,0 +1,21 @@
+from server.settings import get_settings
+
+from .exporters import BatchSpanProcessor, FileSpanExporter, OtlpHttpSpanExporter
+from .tracer import Tracer
+
+
+def create_tracer() -> Tracer:
+    settings = get_settings()
+
+    if settings.tracing_otlp_endpoint:
+        exporter = OtlpHttpSpanExporter(
+            settings.tracing_otlp_endpoint, settings.tracing_service_name
+        )
+    elif settings.tracing_file:
+        exporter = FileSpanExporter(
+            settings.tracing_file, settings.tracing_service_name
+        )
+    else:
+        return Tracer(None, 0)
+
+    return Tracer(BatchSpanProcessor(exporter), settings.tracing_sample_rate)
@@ -0,0 +1,241 @@
+import inspect
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Iterator, Protocol
+
+from sqlalchemy import Engine, event
+
+
+class SpanKind(IntEnum):
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    name: str
+    kind: SpanKind
+    start_time: int
+    end_time: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+class SpanProcessor(Protocol):
+    def on_end(self, span: Span) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Tracer:
+    def __init__(self, processor: SpanProcessor | None, sample_rate: float):
+        self._processor = processor
+        self._sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        return self._processor is not None
+
+    def start_trace(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.SERVER,
+        traceparent: str | None = None,
+        **attributes: Any,
+    ) -> Span | None:
+        if not self.enabled:
+            return None
+
+        trace_id, parent_span_id, sampled = _parse_traceparent(traceparent)
+
+        if sampled is None:
+            sampled = random.random() < self._sample_rate
+
+        if not sampled:
+            return None
+
+        return Span(
+            trace_id=trace_id or _new_id(128),
+            span_id=_new_id(64),
+            parent_span_id=parent_span_id,
+            name=name,
+            kind=kind,
+            start_time=time.time_ns(),
+            attributes=attributes,
+        )
+
+    def start_span(
+        self, name: str, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any
+    ) -> Span | None:
+        parent = current_span.get()
+
+        if parent is None:
+            return None
+
+        return Span(
+            trace_id=parent.trace_id,
+            span_id=_new_id(64),
+            parent_span_id=parent.span_id,
+            name=name,
+            kind=kind,
+            start_time=time.time_ns(),
+            attributes=attributes,
+        )
+
+    def end_span(self, span: Span, error: BaseException | None = None) -> None:
+        span.end_time = time.time_ns()
+
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+
+        self._processor.on_end(span)
+
+    @contextmanager
+    def span(
+        self, name: str, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any
+    ) -> Iterator[Span | None]:
+        span = self.start_span(name, kind, **attributes)
+
+        if span is None:
+            yield None
+            return
+
+        token = current_span.set(span)
+        error = None
+
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            current_span.reset(token)
+            self.end_span(span, error)
+
+    def shutdown(self) -> None:
+        if self._processor is not None:
+            self._processor.shutdown()
+
+
+def _parse_traceparent(
+    traceparent: str | None,
+) -> tuple[str | None, str | None, bool | None]:
+    try:
+        version, trace_id, parent_span_id, flags = traceparent.split("-")
+        int(trace_id, 16), int(parent_span_id, 16)
+        sampled = bool(int(flags, 16) & 1)
+    except (AttributeError, ValueError):
+        return None, None, None
+
+    if version != "00" or len(trace_id) != 32 or len(parent_span_id) != 16:
+        return None, None, None
+
+    return trace_id, parent_span_id, sampled
+
+
+_tracer = Tracer(None, 0)
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    global _tracer
+    _tracer = tracer
+
+
+class Traced:
+    def __init__(self, target: Any, layer: str):
+        self._target = target
+        self._layer = layer
+        self._prefix = type(target).__name__
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        span_name = f"{self._prefix}.{name}"
+        layer = self._layer
+
+        if inspect.iscoroutinefunction(attribute):
+
+            async def traced_async_call(*args, **kwargs):
+                if current_span.get() is None:
+                    return await attribute(*args, **kwargs)
+
+                with _tracer.span(span_name, layer=layer):
+                    return await attribute(*args, **kwargs)
+
+            return traced_async_call
+
+        def traced_call(*args, **kwargs):
+            if current_span.get() is None:
+                return attribute(*args, **kwargs)
+
+            with _tracer.span(span_name, layer=layer):
+                return attribute(*args, **kwargs)
+
+        return traced_call
+
+
+def traced(target: Any, layer: str) -> Any:
+    return Traced(target, layer) if _tracer.enabled else target
+
+
+def trace_engines() -> None:
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is None or current_span.get() is None:
+        return
+
+    context.trace_span = _tracer.start_span(
+        statement.split(None, 1)[0].upper(),
+        SpanKind.CLIENT,
+        layer="sql",
+        **{
+            "db.system": conn.dialect.name,
+            "db.statement": statement[:2000],
+        },
+    )
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = getattr(context, "trace_span", None)
+
+    if span is not None:
+        context.trace_span = None
+        _tracer.end_span(span)
+
+
+def _handle_error(exception_context) -> None:
+    context = exception_context.execution_context
+    span = getattr(context, "trace_span", None)
+
+    if span is not None:
+        context.trace_span = None
+        _tracer.end_span(span, exception_context.original_exception)
@@ -0,0 +1,34 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+
+# Importing the server builds its engines from the settings, so give the
+# required ones placeholder values. Nothing connects to this database.
+os.environ.setdefault("POSTGRES_USERNAME", "postgres")
+os.environ.setdefault("POSTGRES_PASSWORD", "postgres")
+os.environ.setdefault("POSTGRES_HOST", "localhost")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+os.environ.setdefault("SECRET_KEY", "0123456789abcdef0123456789abcdef")
+
+
+@pytest.fixture(scope="session")
+def postgresql_url() -> str:
+    """URL of a scratch PostgreSQL database, from TEST_POSTGRESQL_URL."""
+    url = os.environ.get("TEST_POSTGRESQL_URL")
+
+    if not url:
+        pytest.skip("TEST_POSTGRESQL_URL is not set")
+
+    engine = create_engine(url)
+
+    try:
+        with engine.connect():
+            pass
+    except OperationalError as e:
+        pytest.skip(f"PostgreSQL is not available: {e}")
+    finally:
+        engine.dispose()
+
+    return url
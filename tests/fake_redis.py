@@ -0,0 +1,44 @@
+import time
+
+from redis import ConnectionError
+
+
+class FakeRedis:
+    """In-memory stand-in for the parts of redis.Redis the cache backend uses."""
+
+    def __init__(self):
+        self._values: dict[str, tuple[bytes, float | None]] = {}
+        self.available = True
+
+    def get(self, key: str) -> bytes | None:
+        self._check_available()
+        entry = self._values.get(key)
+
+        if entry is None:
+            return None
+
+        value, expires = entry
+
+        if expires is not None and time.monotonic() >= expires:
+            del self._values[key]
+            return None
+
+        return value
+
+    def set(self, key: str, value: str | bytes, px: int | None = None) -> bool:
+        self._check_available()
+
+        if isinstance(value, str):
+            value = value.encode()
+
+        expires = time.monotonic() + px / 1000 if px is not None else None
+        self._values[key] = (value, expires)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        self._check_available()
+        return sum(self._values.pop(key, None) is not None for key in keys)
+
+    def _check_available(self) -> None:
+        if not self.available:
+            raise ConnectionError("Redis is not available")
@@ -0,0 +1,53 @@
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from benchmarks.compare import REFERENCE, compare, load
+from benchmarks.conversions import Fixtures, benchmarks, measure
+
+BASELINE = load(
+    Path(__file__).resolve().parent.parent / "benchmarks" / "conversions_baseline.json"
+)
+THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", 0.2))
+ATTEMPTS = 3
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def suite():
+    return benchmarks(Fixtures(BASELINE["employee_from_db"]["rows"]))
+
+
+@pytest.fixture(scope="module")
+def reference(suite) -> dict:
+    rows, function = suite[REFERENCE]
+    return asdict(measure(REFERENCE, rows, function, BASELINE[REFERENCE]["rounds"]))
+
+
+# Timings are taken relative to the reference benchmark of the same run, so
+# the baseline does not depend on the speed of the machine that recorded it.
+# It does depend on the Python version, so regenerate it with
+# python -m benchmarks.conversions --output benchmarks/conversions_baseline.json
+# after upgrading. A
+# benchmark is measured again before failing, so a burst of load on a shared
+# machine does not fail the run on its own.
+@pytest.mark.parametrize("name", [name for name in BASELINE if name != REFERENCE])
+def test_conversion_did_not_regress(suite, reference, name):
+    rows, function = suite[name]
+
+    for _ in range(ATTEMPTS):
+        result = measure(name, rows, function, BASELINE[name]["rounds"])
+        change = compare(
+            BASELINE[name], asdict(result), "min", BASELINE[REFERENCE], reference
+        )
+
+        if change <= THRESHOLD:
+            break
+
+    assert change <= THRESHOLD, (
+        f"{name}: {BASELINE[name]['min'] * 1e6:.2f} -> "
+        f"{result.min * 1e6:.2f} us/row ({change:+.1%} relative to {REFERENCE})"
+    )
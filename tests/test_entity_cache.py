@@ -0,0 +1,191 @@
+import pytest
+
+from server.cache.lru_cache import LRUCache
+from server.cache.lru_cache_backend import LRUCacheBackend
+from server.cache.redis_cache_backend import RedisCacheBackend
+from server.model.company import Company
+from server.model.department import Department
+from server.repo.cached_companies_repository import CachedCompaniesRepository
+from server.repo.cached_departments_repository import CachedDepartmentsRepository
+
+from .fake_redis import FakeRedis
+
+
+class InMemoryCompaniesRepository:
+    def __init__(self, companies: list[Company]):
+        self.companies = {company.id: company for company in companies}
+        self.lookups = 0
+
+    def get_company(self, company_id: int) -> Company:
+        self.lookups += 1
+        return self.companies.get(company_id)
+
+    def edit_company(self, company_id: int, *, name: str = None, **fields) -> None:
+        company = self.companies[company_id]
+        self.companies[company_id] = Company(
+            name=name or company.name,
+            inn=company.inn,
+            kpp=company.kpp,
+            owner_id=company.owner_id,
+            id=company.id,
+        )
+
+    def delete_company(self, company_id: int) -> None:
+        del self.companies[company_id]
+
+
+class InMemoryDepartmentsRepository:
+    def __init__(self, departments: list[Department]):
+        self.departments = {department.id: department for department in departments}
+        self.lookups = 0
+
+    def get_department(self, department_id: int) -> Department:
+        self.lookups += 1
+        return self.departments.get(department_id)
+
+
+COMPANY = Company(name="Компания", inn="1234567890", kpp="123456789", owner_id=1, id=1)
+DEPARTMENT = Department(id=2, owner_id=1, name="Отдел", company_id=1)
+
+
+@pytest.fixture(params=["lru", "redis"])
+def cache(request):
+    if request.param == "lru":
+        return LRUCacheBackend(LRUCache(100, 60))
+    return RedisCacheBackend(FakeRedis(), 60, prefix="test:")
+
+
+@pytest.fixture
+def transaction_end_callbacks() -> list:
+    return []
+
+
+@pytest.fixture
+def published() -> list:
+    return []
+
+
+@pytest.fixture
+def companies_repository() -> InMemoryCompaniesRepository:
+    return InMemoryCompaniesRepository([COMPANY])
+
+
+@pytest.fixture
+def departments_repository() -> InMemoryDepartmentsRepository:
+    return InMemoryDepartmentsRepository([DEPARTMENT])
+
+
+@pytest.fixture
+def companies(companies_repository, cache, transaction_end_callbacks, published):
+    return CachedCompaniesRepository(
+        companies_repository,
+        cache,
+        transaction_end_callbacks.append,
+        published.extend,
+    )
+
+
+@pytest.fixture
+def departments(
+    departments_repository, companies, cache, transaction_end_callbacks, published
+):
+    return CachedDepartmentsRepository(
+        departments_repository,
+        companies,
+        cache,
+        transaction_end_callbacks.append,
+        published.extend,
+    )
+
+
+def test_counts_hits_and_misses(cache):
+    assert cache.get("company:1") is None
+    cache.put("company:1", {"name": "Компания"})
+
+    assert cache.get("company:1") == {"name": "Компания"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_reads_company_through(companies, companies_repository):
+    assert companies.get_company(COMPANY.id) == COMPANY
+    assert companies.get_company(COMPANY.id) == COMPANY
+    assert companies_repository.lookups == 1
+
+
+def test_reads_department_through(departments, departments_repository):
+    assert departments.get_department(DEPARTMENT.id) == DEPARTMENT
+    assert departments.get_department(DEPARTMENT.id) == DEPARTMENT
+    assert departments_repository.lookups == 1
+
+
+def test_does_not_populate_from_replica(cache, transaction_end_callbacks, published):
+    companies = CachedCompaniesRepository(
+        InMemoryCompaniesRepository([COMPANY]),
+        cache,
+        transaction_end_callbacks.append,
+        published.extend,
+        populate_cache=lambda: False,
+    )
+    companies.get_company(COMPANY.id)
+
+    assert cache.get(f"company:{COMPANY.id}") is None
+
+
+@pytest.mark.parametrize("write", ["edit", "delete"])
+def test_company_writes_evict(
+    companies, cache, transaction_end_callbacks, published, write
+):
+    key = f"company:{COMPANY.id}"
+    companies.get_company(COMPANY.id)
+
+    if write == "edit":
+        companies.edit_company(COMPANY.id, name="Новая")
+    else:
+        companies.delete_company(COMPANY.id)
+
+    assert cache.get(key) is None
+    assert published == [key]
+
+    # A concurrent reader may cache the old row again before the commit.
+    cache.put(key, {"stale": True})
+    for callback in transaction_end_callbacks:
+        callback()
+    assert cache.get(key) is None
+
+
+def test_invalidate_department_evicts(
+    departments, cache, transaction_end_callbacks, published
+):
+    key = f"department:{DEPARTMENT.id}"
+    departments.get_department(DEPARTMENT.id)
+    departments.invalidate_department(DEPARTMENT.id)
+
+    assert cache.get(key) is None
+    assert published == [key]
+
+    cache.put(key, {"stale": True})
+    for callback in transaction_end_callbacks:
+        callback()
+    assert cache.get(key) is None
+
+
+def test_redis_errors_are_misses(
+    companies_repository, transaction_end_callbacks, published
+):
+    client = FakeRedis()
+    cache = RedisCacheBackend(client, 60)
+    companies = CachedCompaniesRepository(
+        companies_repository,
+        cache,
+        transaction_end_callbacks.append,
+        published.extend,
+    )
+    companies.get_company(COMPANY.id)
+    client.available = False
+
+    assert companies.get_company(COMPANY.id) == COMPANY
+    assert companies_repository.lookups == 2
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    companies.edit_company(COMPANY.id, name="Новая")
+    assert companies.get_company(COMPANY.id).name == "Новая"
@@ -0,0 +1,120 @@
+import datetime
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, select, text
+
+from server.database.database import Base
+from server.database.models import (
+    Action as DbAction,
+    Company as DbCompany,
+    Department as DbDepartment,
+    Employee as DbEmployee,
+    RefreshToken as DbRefreshToken,
+)
+
+SERVER_DIR = Path(__file__).resolve().parent.parent / "server"
+NOW = datetime.datetime(2024, 1, 1)
+
+KEY_QUERIES = {
+    "actions of an employee": (
+        select(DbAction).filter_by(employee_id=1).order_by(DbAction.date),
+        "ix_actions_employee_id_date",
+    ),
+    "actions on a date": (
+        select(DbAction).filter(DbAction.date == NOW.date()),
+        "ix_actions_date",
+    ),
+    "departments of a company": (
+        select(DbDepartment).filter_by(company_id=1),
+        "ix_departments_company_id",
+    ),
+    "companies of a user": (
+        select(DbCompany).filter_by(owner_id=1),
+        "ix_companies_owner_id",
+    ),
+    "employees of a user": (
+        select(DbEmployee).filter_by(owner_id=1),
+        "ix_employees_owner_id",
+    ),
+    "refresh token by hash": (
+        select(DbRefreshToken)
+        .filter_by(token_hash="0" * 64)
+        .filter(DbRefreshToken.expires > NOW),
+        "ix_refresh_tokens_token_hash",
+    ),
+    "expired refresh tokens": (
+        select(DbRefreshToken.id).filter(DbRefreshToken.expires <= NOW).limit(1000),
+        "ix_refresh_tokens_expires",
+    ),
+}
+
+
+def migrate(database_url: str) -> Engine:
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(engine)
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=SERVER_DIR,
+        env={**os.environ, "DATABASE_URL": database_url},
+        check=True,
+    )
+    return engine
+
+
+def _postgresql_indexes(plan: dict) -> set[str]:
+    indexes = {plan["Index Name"]} if "Index Name" in plan else set()
+    for subplan in plan.get("Plans", []):
+        indexes |= _postgresql_indexes(subplan)
+    return indexes
+
+
+def used_indexes(engine: Engine, statement) -> tuple[str, set[str]]:
+    sql = str(
+        statement.compile(
+            dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            # The tables are empty, so make the planner show whether an index
+            # is usable instead of picking a sequential scan.
+            conn.execute(text("SET enable_seqscan = off"))
+            plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return json.dumps(plan), _postgresql_indexes(plan[0]["Plan"])
+
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+        details = "; ".join(row[-1] for row in rows)
+        return details, set(re.findall(r"USING (?:COVERING )?INDEX (\w+)", details))
+
+
+@pytest.fixture(scope="module", params=["sqlite", "postgresql"])
+def engine(request, tmp_path_factory):
+    if request.param == "sqlite":
+        database_url = f"sqlite:///{tmp_path_factory.mktemp('indexes') / 'db.sqlite'}"
+    else:
+        database_url = request.getfixturevalue("postgresql_url")
+
+    engine = migrate(database_url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("query", KEY_QUERIES)
+def test_key_query_uses_index(engine, query):
+    statement, index = KEY_QUERIES[query]
+    plan, indexes = used_indexes(engine, statement)
+
+    assert index in indexes, plan
@@ -0,0 +1,94 @@
+import json
+import queue
+from threading import Event
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from server.cache.invalidation_bus import InvalidationBus
+
+TIMEOUT = 5
+
+
+class Listener:
+    def __init__(self, bus: InvalidationBus, cache: str = "entities"):
+        self.evicted = queue.Queue()
+        self.connected = Event()
+        # The caches are cleared once the bus is listening.
+        bus.register(cache, self.evicted.put, self.connected.set)
+
+
+@pytest.fixture
+def engine(postgresql_url):
+    engine = create_engine(postgresql_url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def buses(engine):
+    buses = [InvalidationBus(engine, reconnect_interval=0.1) for _ in range(2)]
+    listeners = [Listener(bus) for bus in buses]
+
+    for bus, listener in zip(buses, listeners):
+        bus.start()
+        assert listener.connected.wait(TIMEOUT)
+
+    yield list(zip(buses, listeners))
+
+    for bus in buses:
+        bus.stop()
+
+
+def test_delivers_committed_keys_to_other_buses(engine, buses):
+    (publisher, own), (_, other) = buses
+
+    with Session(engine) as db:
+        publisher.publish(db, "entities", ["company:1", "department:2"])
+        db.commit()
+
+    assert other.evicted.get(timeout=TIMEOUT) == ["company:1", "department:2"]
+    with pytest.raises(queue.Empty):
+        own.evicted.get(timeout=0.5)
+
+
+def test_drops_rolled_back_keys(engine, buses):
+    (publisher, _), (_, other) = buses
+
+    with Session(engine) as db:
+        publisher.publish(db, "entities", ["company:1"])
+        db.rollback()
+
+    with Session(engine) as db:
+        publisher.publish(db, "entities", ["company:2"])
+        db.commit()
+
+    # Notifications arrive in commit order, so the rolled back one would
+    # have come first.
+    assert other.evicted.get(timeout=TIMEOUT) == ["company:2"]
+
+
+def test_publish_is_a_no_op_on_other_dialects():
+    engine = create_engine("sqlite://")
+    bus = InvalidationBus(engine)
+
+    with Session(engine) as db:
+        bus.publish(db, "entities", ["company:1"])
+        assert not db.in_transaction()
+
+    assert not bus.enabled
+
+
+def test_handle_skips_own_and_malformed_messages():
+    bus = InvalidationBus(create_engine("sqlite://"))
+    listener = Listener(bus)
+
+    bus.handle("not json")
+    bus.handle(json.dumps({"keys": ["company:1"]}))
+    bus.handle(json.dumps({"cache": "unknown", "keys": ["company:1"]}))
+    bus.handle(json.dumps({"origin": bus._origin, "cache": "entities", "keys": ["a"]}))
+    bus.handle(json.dumps({"origin": "other", "cache": "entities", "keys": ["b"]}))
+
+    assert listener.evicted.get_nowait() == ["b"]
+    assert listener.evicted.empty()
@@ -0,0 +1,68 @@
+import pytest
+
+from server.cache.lru_cache import LRUCache
+from server.model.ownership import Ownership
+from server.services.ownership_service import OwnershipService
+
+
+class NotFound(Exception):
+    pass
+
+
+class Forbidden(Exception):
+    pass
+
+
+class InMemoryOwnershipRepository:
+    def __init__(self, company_owners: dict[int, int]):
+        self.company_owners = company_owners
+        self.owner_lookups = 0
+
+    def get_ownership(self, user_id: int) -> Ownership:
+        return Ownership(
+            company_ids=frozenset(
+                company_id
+                for company_id, owner_id in self.company_owners.items()
+                if owner_id == user_id
+            ),
+            department_ids=frozenset(),
+            employee_ids=frozenset(),
+        )
+
+    def get_company_owner(self, company_id: int) -> int | None:
+        self.owner_lookups += 1
+        return self.company_owners.get(company_id)
+
+
+@pytest.fixture
+def repository() -> InMemoryOwnershipRepository:
+    return InMemoryOwnershipRepository({1: 10, 2: 20})
+
+
+@pytest.fixture
+def ownership_service(repository) -> OwnershipService:
+    return OwnershipService(repository, LRUCache(10))
+
+
+def test_allows_owned_from_the_claims(ownership_service, repository):
+    ownership_service.require_company(10, 1, NotFound, Forbidden)
+
+    assert repository.owner_lookups == 0
+
+
+def test_raises_given_errors(ownership_service):
+    with pytest.raises(Forbidden):
+        ownership_service.require_company(10, 2, NotFound, Forbidden)
+
+    with pytest.raises(NotFound):
+        ownership_service.require_company(10, 3, NotFound, Forbidden)
+
+
+def test_falls_back_to_the_owner_when_the_claims_are_stale(
+    ownership_service, repository
+):
+    ownership_service.require_company(10, 1, NotFound, Forbidden)
+    repository.company_owners[3] = 10
+
+    ownership_service.require_company(10, 3, NotFound, Forbidden)
+    assert repository.owner_lookups == 1
@@ -0,0 +1,39 @@
+import asyncio
+from threading import Event
+
+import pytest
+
+from server.model.auth.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+
+def test_hashes_and_verifies():
+    async def run():
+        hasher = PasswordHasher(rounds=4, workers=1, queue_size=0)
+        password_hash = await hasher.hash("password")
+
+        assert await hasher.verify_and_update("password", password_hash) == (
+            True,
+            None,
+        )
+        assert (await hasher.verify_and_update("wrong", password_hash))[0] is False
+        assert hasher.queue_depth == 0
+
+    asyncio.run(run())
+
+
+def test_rejects_work_beyond_its_capacity():
+    async def run():
+        hasher = PasswordHasher(rounds=4, workers=1, queue_size=1)
+        release = Event()
+        hasher._context.hash = lambda password: release.wait() and password
+
+        pending = [asyncio.ensure_future(hasher.hash("password")) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.hash("password")
+
+        release.set()
+        assert await asyncio.gather(*pending) == ["password", "password"]
+
+    asyncio.run(run())
@@ -0,0 +1,99 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from benchmarks.seed import seed_tenant
+from server.cache.lru_cache import LRUCache
+from server.database.database import Base
+from server.repo.actions_repository_impl import ActionsRepositoryImpl
+from server.repo.companies_repository_impl import CompaniesRepositoryImpl
+from server.repo.departments_repository_impl import DepartmentsRepositoryImpl
+from server.repo.employees_repository_impl import EmployeesRepositoryImpl
+from server.repo.ownership_repository_impl import OwnershipRepositoryImpl
+from server.services.employees_service_impl import EmployeesServiceImpl
+from server.services.ownership_service import OwnershipService
+from server.services.snapshots_service_impl import SnapshotsServiceImpl
+
+EMPLOYEES = 60
+
+
+class Tenant:
+    def __init__(self, departments: int):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(self.engine)
+
+        with Session(self.engine) as db:
+            self.seeded = seed_tenant(db, departments, EMPLOYEES, password_hash="-")
+
+        self.queries = 0
+        event.listen(self.engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args) -> None:
+        self.queries += 1
+
+    def count_queries(self, call) -> int:
+        with Session(self.engine) as db:
+            companies_repository = CompaniesRepositoryImpl(db)
+            departments_repository = DepartmentsRepositoryImpl(db)
+            employees_repository = EmployeesRepositoryImpl(db)
+            actions_repository = ActionsRepositoryImpl(db)
+            ownership_service = OwnershipService(
+                OwnershipRepositoryImpl(db), LRUCache(10)
+            )
+            services = {
+                "employees": EmployeesServiceImpl(
+                    employees_repository,
+                    companies_repository,
+                    departments_repository,
+                    actions_repository,
+                    ownership_service,
+                ),
+                "snapshots": SnapshotsServiceImpl(
+                    companies_repository,
+                    departments_repository,
+                    employees_repository,
+                    actions_repository,
+                    ownership_service,
+                ),
+            }
+            before = self.queries
+            call(services, self.seeded)
+            return self.queries - before
+
+
+@pytest.fixture(scope="module")
+def tenants() -> tuple[Tenant, Tenant]:
+    tenants = Tenant(2), Tenant(30)
+    yield tenants
+
+    for tenant in tenants:
+        tenant.engine.dispose()
+
+
+def test_employee_batch_does_not_grow_with_departments(tenants):
+    def get_batch(services, seeded):
+        batch = services["employees"].get_employees_by_ids(
+            seeded.user_id, seeded.employee_ids
+        )
+        assert len(batch.items) == EMPLOYEES
+
+    few, many = (tenant.count_queries(get_batch) for tenant in tenants)
+
+    assert few == many
+
+
+@pytest.mark.parametrize("include_actions", [False, True])
+def test_snapshot_does_not_grow_with_departments(tenants, include_actions):
+    def get_snapshot(services, seeded):
+        services["snapshots"].get_company_snapshot(
+            seeded.user_id, seeded.company_id, include_actions
+        )
+
+    few, many = (tenant.count_queries(get_snapshot) for tenant in tenants)
+
+    assert few == many
@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from server.database.database import Base, on_transaction_end
+from server.database.models import User
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        yield db
+
+    engine.dispose()
+
+
+def test_runs_after_commit_not_flush(db):
+    calls = []
+    on_transaction_end(db, lambda: calls.append("end"))
+
+    db.add(User(email="a@example.com", password_hash="-"))
+    db.flush()
+    savepoint = db.begin_nested()
+    db.add(User(email="b@example.com", password_hash="-"))
+    savepoint.rollback()
+    assert calls == []
+
+    db.commit()
+    db.add(User(email="c@example.com", password_hash="-"))
+    db.commit()
+    assert calls == ["end"]
+
+
+def test_runs_after_rollback(db):
+    calls = []
+    on_transaction_end(db, lambda: calls.append("end"))
+
+    db.add(User(email="a@example.com", password_hash="-"))
+    db.flush()
+    assert calls == []
+
+    db.rollback()
+    assert calls == ["end"]